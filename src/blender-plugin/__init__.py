@@ -8,19 +8,41 @@ bl_info = {
 }
 
 import bpy
+import aud
 import json
 import os
+import stat
 import tempfile
 import subprocess
 import shutil
 import platform
 import hashlib
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import socket
+import threading
+import time
+import types
+import wave
+from typing import Optional, List, Dict, Any, Tuple
 import math
+import numpy as np
 from bpy_extras.io_utils import ImportHelper
 
+# orjson isn't bundled with Blender; stdlib json.loads also accepts bytes
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Optional too: streams a single array out of a large JSON file without the rest
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Simple ARPAbet to viseme mapping (customize as needed)
-ARPABET_TO_VISEME = {
+ARPABET_TO_VISEME = types.MappingProxyType({
     "AA": "viseme_AA", "AE": "viseme_AA", "AH": "viseme_AA", "AO": "viseme_AA",
     "AW": "viseme_AA", "AY": "viseme_AA", "B": "viseme_BM", "M": "viseme_BM", "P": "viseme_BM",
     "CH": "viseme_CH", "JH": "viseme_CH", "D": "viseme_D", "DH": "viseme_D", "T": "viseme_D",
@@ -30,110 +52,246 @@ ARPABET_TO_VISEME = {
     "OW": "viseme_O", "OY": "viseme_O", "UH": "viseme_O", "UW": "viseme_O",
     "R": "viseme_R", "S": "viseme_S", "Z": "viseme_S", "SH": "viseme_SH", "ZH": "viseme_SH",
     "TH": "viseme_TH", "W": "viseme_W", "Y": "viseme_Y"
-}
+})
+VALID_VISEMES = frozenset(ARPABET_TO_VISEME.values())
+# Also keyed on stress-marked variants (AA0, AA1, ...) so strip names need no stripping
+PHONEME_TO_VISEME = types.MappingProxyType({
+    ph + stress: viseme
+    for ph, viseme in ARPABET_TO_VISEME.items()
+    for stress in ("", "0", "1", "2")
+})
 
 # Use the global CLI
 CLI_COMMAND = "text-to-face"
 
+_SYSTEM = platform.system()
+
+def get_config_path(filename: str) -> str:
+    return os.path.join(bpy.utils.user_resource('CONFIG'), filename)
+
+def _load_json_file(path: str) -> Optional[Any]:
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _save_json_file(path: str, data: Any) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename, so a reader (or a crash) never sees a half-written file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[Text-to-Face] Failed to write {path}: {e}")
+
+def _python_script_dirs(parent: str) -> List[str]:
+    # Any installed PythonXY under parent, instead of a hardcoded version list
+    try:
+        with os.scandir(parent) as it:
+            return [os.path.join(entry.path, "Scripts") for entry in it
+                    if entry.name.startswith("Python") and entry.is_dir()]
+    except OSError:
+        return []
+
+def _probe_login_shell_path(cmd: List[str]) -> Optional[List[str]]:
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+        if result.returncode == 0:
+            return result.stdout.strip().split(':')
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        pass
+    except Exception as e:
+        print(f"[Text-to-Face] Shell PATH probe failed: {e}")
+    return None
+
+def _first_login_shell_path(shell_commands: List[List[str]], timeout: float = 5) -> Optional[List[str]]:
+    # Shells start at once but answer in list order; the rest are killed
+    deadline = time.monotonic() + timeout
+    procs = []
+    for cmd in shell_commands:
+        try:
+            procs.append(subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                          stderr=subprocess.DEVNULL, text=True))
+        except OSError:
+            pass
+    try:
+        for proc in procs:
+            try:
+                stdout, _ = proc.communicate(timeout=max(deadline - time.monotonic(), 0.1))
+            except subprocess.TimeoutExpired:
+                continue
+            if proc.returncode == 0:
+                return stdout.strip().split(':')
+        return None
+    finally:
+        for proc in procs:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+
+def _extend_unique(paths: List[str], extra: List[str]) -> None:
+    # Set-backed membership; a login-shell PATH can have hundreds of entries
+    seen = set(paths)
+    for p in extra:
+        if p and p not in seen:
+            paths.append(p)
+            seen.add(p)
+
+def _darwin_paths() -> List[str]:
+    paths = [
+        "/usr/local/bin",
+        "/opt/homebrew/bin",
+        "/opt/homebrew/sbin",
+        "/usr/bin",
+        "/bin",
+        "/usr/sbin",
+        "/sbin"
+    ]
+    shell_commands = [
+        ["/bin/zsh", "-l", "-c", "echo $PATH"],
+        ["/bin/bash", "-l", "-c", "echo $PATH"]
+    ]
+    shell_paths = _first_login_shell_path(shell_commands)
+    if shell_paths is not None:
+        _extend_unique(paths, shell_paths)
+    return paths
+
+def _linux_paths() -> List[str]:
+    paths = [
+        "/usr/local/bin",
+        "/usr/bin",
+        "/bin",
+        "/usr/sbin",
+        "/sbin",
+        "/snap/bin",
+        "/usr/local/sbin"
+    ]
+    shell_paths = _probe_login_shell_path(["/bin/bash", "-l", "-c", "echo $PATH"])
+    if shell_paths is not None:
+        _extend_unique(paths, shell_paths)
+    return paths
+
+def _windows_paths() -> List[str]:
+    paths = [
+        r"C:\Windows\System32",
+        r"C:\Windows",
+        r"C:\Windows\System32\WindowsPowerShell\v1.0",
+        r"C:\Program Files\Git\bin",
+    ]
+    paths.extend(_python_script_dirs(r"C:\Program Files"))
+    return paths
+
+def _user_paths() -> List[str]:
+    home = os.path.expanduser("~")
+    user_paths = [
+        os.path.join(home, ".local", "bin"),
+        os.path.join(home, "bin"),
+        os.path.join(home, ".cargo", "bin"),
+        os.path.join(home, "go", "bin"),
+    ]
+    if _SYSTEM == "Windows":
+        user_paths.extend(_python_script_dirs(os.path.join(home, "AppData", "Local", "Programs", "Python")))
+        user_paths.extend(_python_script_dirs(os.path.join(home, "AppData", "Roaming", "Python")))
+    return user_paths
+
+# Chosen once at import rather than re-tested on every runner construction
+_SHELL_PATH_FN = {
+    "Darwin": _darwin_paths,
+    "Linux": _linux_paths,
+    "Windows": _windows_paths,
+}.get(_SYSTEM, list)
+
 # --- BlenderCommandRunner for robust CLI discovery ---
 class BlenderCommandRunner:
     """Safe cross-platform command runner for Blender environments"""
+    COMMAND_CACHE_FILE = "texttoface_commands.json"
+    PATH_CACHE_FILE = "texttoface_path.json"
+    SHELL_RC_FILES = (".zprofile", ".zshrc", ".bash_profile", ".bashrc", ".profile")
     def __init__(self):
-        self.system = platform.system()
-        self.extended_env = self._get_extended_environment()
-    def _get_shell_paths(self) -> List[str]:
-        additional_paths = []
-        if self.system == "Darwin":
-            paths = [
-                "/usr/local/bin",
-                "/opt/homebrew/bin",
-                "/opt/homebrew/sbin",
-                "/usr/bin",
-                "/bin",
-                "/usr/sbin",
-                "/sbin"
-            ]
-            shell_commands = [
-                ["/bin/zsh", "-l", "-c", "echo $PATH"],
-                ["/bin/bash", "-l", "-c", "echo $PATH"]
-            ]
-            for cmd in shell_commands:
-                try:
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        shell_paths = result.stdout.strip().split(':')
-                        paths.extend([p for p in shell_paths if p and p not in paths])
-                        break
-                except:
-                    continue
-            additional_paths.extend(paths)
-        elif self.system == "Linux":
-            paths = [
-                "/usr/local/bin",
-                "/usr/bin",
-                "/bin",
-                "/usr/sbin",
-                "/sbin",
-                "/snap/bin",
-                "/usr/local/sbin"
-            ]
-            try:
-                result = subprocess.run(["/bin/bash", "-l", "-c", "echo $PATH"], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    shell_paths = result.stdout.strip().split(':')
-                    paths.extend([p for p in shell_paths if p and p not in paths])
-            except:
-                pass
-            additional_paths.extend(paths)
-        elif self.system == "Windows":
-            paths = [
-                r"C:\Windows\System32",
-                r"C:\Windows",
-                r"C:\Windows\System32\WindowsPowerShell\v1.0",
-                r"C:\Program Files\Git\bin",
-                r"C:\Program Files\Python39\Scripts",
-                r"C:\Program Files\Python310\Scripts",
-                r"C:\Program Files\Python311\Scripts",
-                r"C:\Program Files\Python312\Scripts"
-            ]
-            additional_paths.extend(paths)
+        self.system = _SYSTEM
+        self._shell_paths_stale = False
+        self.extended_path = self._get_extended_path()
+        self._resolved: Dict[str, str] = self._load_resolved()
+    def _load_resolved(self) -> Dict[str, str]:
+        # Only trust persisted paths that still point at an executable
+        data = _load_json_file(get_config_path(self.COMMAND_CACHE_FILE))
+        if not isinstance(data, dict):
+            return {}
+        return {cmd: path for cmd, path in data.items()
+                if isinstance(path, str) and os.path.isfile(path) and os.access(path, os.X_OK)}
+    def clear_command_cache(self) -> None:
+        self._resolved.clear()
+        try:
+            os.remove(get_config_path(self.COMMAND_CACHE_FILE))
+        except OSError:
+            pass
+    def rescan(self) -> None:
+        try:
+            os.remove(get_config_path(self.PATH_CACHE_FILE))
+        except OSError:
+            pass
+        self.extended_path = self._get_extended_path()
+        self.clear_command_cache()
+    def _path_cache_key(self) -> str:
+        # Login-shell PATH only changes with the shell, the inherited PATH or the rc files
         home = os.path.expanduser("~")
-        user_paths = [
-            os.path.join(home, ".local", "bin"),
-            os.path.join(home, "bin"),
-            os.path.join(home, ".cargo", "bin"),
-            os.path.join(home, "go", "bin"),
-        ]
-        if self.system == "Windows":
-            user_paths.extend([
-                os.path.join(home, "AppData", "Local", "Programs", "Python", "Python311", "Scripts"),
-                os.path.join(home, "AppData", "Roaming", "Python", "Python311", "Scripts"),
-            ])
-        additional_paths.extend(user_paths)
-        return [path for path in additional_paths if os.path.isdir(path)]
-    def _get_extended_environment(self) -> Dict[str, str]:
-        env = os.environ.copy()
-        current_path = env.get('PATH', '')
+        parts = [self.system, os.environ.get("SHELL", ""), os.environ.get("PATH", "")]
+        for name in self.SHELL_RC_FILES:
+            try:
+                parts.append(str(os.stat(os.path.join(home, name)).st_mtime))
+            except OSError:
+                parts.append("")
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+    def _get_cached_shell_paths(self) -> List[str]:
+        cache_path = get_config_path(self.PATH_CACHE_FILE)
+        key = self._path_cache_key()
+        cached = _load_json_file(cache_path)
+        if isinstance(cached, dict) and cached.get("key") == key and isinstance(cached.get("paths"), list):
+            # May predate an install the key can't see
+            self._shell_paths_stale = True
+            return cached["paths"]
+        self._shell_paths_stale = False
+        paths = self._get_shell_paths()
+        _save_json_file(cache_path, {"key": key, "paths": paths})
+        return paths
+    def _get_shell_paths(self) -> List[str]:
+        additional_paths = _SHELL_PATH_FN() + _user_paths()
+        # Dedupe first so each directory is stat'ed once
+        return [path for path in dict.fromkeys(additional_paths) if os.path.isdir(path)]
+    def _get_extended_path(self) -> str:
+        current_path = os.environ.get('PATH', '')
         path_separator = ';' if self.system == "Windows" else ':'
-        additional_paths = self._get_shell_paths()
-        all_paths = additional_paths + [current_path] if current_path else additional_paths
-        env['PATH'] = path_separator.join(all_paths)
-        return env
+        all_paths = self._get_cached_shell_paths() + current_path.split(path_separator)
+        return path_separator.join(p for p in dict.fromkeys(all_paths) if p)
+    @property
+    def extended_env(self) -> Dict[str, str]:
+        # Built per call instead of keeping a full os.environ copy alive
+        return {**os.environ, 'PATH': self.extended_path}
     def find_command(self, command: str) -> Optional[str]:
-        command_path = shutil.which(command, path=self.extended_env.get('PATH'))
-        if command_path:
-            return command_path
-        command_path = shutil.which(command)
+        if command in self._resolved:
+            return self._resolved[command]
+        command_path = shutil.which(command, path=self.extended_path) or shutil.which(command)
+        if not command_path and self._shell_paths_stale:
+            # Re-probe the login shells once before reporting the command missing
+            self.rescan()
+            command_path = shutil.which(command, path=self.extended_path) or shutil.which(command)
         if command_path:
-            return command_path
-        return None
-    def run_command(self, command: List[str], timeout: int = 30, capture_output: bool = True, text: bool = True, check: bool = True) -> subprocess.CompletedProcess:
+            self._resolved[command] = command_path
+            _save_json_file(get_config_path(self.COMMAND_CACHE_FILE), self._resolved)
+        return command_path
+    def _resolve_command(self, command: List[str]) -> List[str]:
         if not command:
             raise ValueError("Command cannot be empty")
         command_path = self.find_command(command[0])
         if not command_path:
             raise FileNotFoundError(f"Command '{command[0]}' not found in PATH")
-        full_command = [command_path] + command[1:]
+        return [command_path] + command[1:]
+    def run_command(self, command: List[str], timeout: int = 30, capture_output: bool = True, text: bool = True, check: bool = True) -> subprocess.CompletedProcess:
+        full_command = self._resolve_command(command)
         return subprocess.run(
             full_command,
             env=self.extended_env,
@@ -142,40 +300,543 @@ class BlenderCommandRunner:
             text=text,
             check=check
         )
+    def start_command(self, command: List[str], **popen_kwargs) -> subprocess.Popen:
+        # Non-blocking variant of run_command; the caller polls the returned process
+        return subprocess.Popen(self._resolve_command(command), env=self.extended_env, **popen_kwargs)
     def test_command(self, command: str, args: List[str] = None) -> bool:
         try:
             test_args = args or ["--version"]
             result = self.run_command([command] + test_args, timeout=10, capture_output=True, check=False)
             return result.returncode == 0
-        except:
+        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
             return False
+        except Exception as e:
+            print(f"[Text-to-Face] Failed to run {command}: {e}")
+            return False
+
+def _singleton(factory):
+    # lru_cache alone can run the factory twice when two threads race on the first call
+    cached = functools.lru_cache(maxsize=1)(factory)
+    lock = threading.Lock()
+    @functools.wraps(factory)
+    def get():
+        with lock:
+            return cached()
+    get.cache_info = cached.cache_info
+    get.cache_clear = cached.cache_clear
+    return get
 
 # --- Use the runner for all CLI calls ---
-runner = BlenderCommandRunner()
+# Built on first use: the shell PATH probe is slow
+@_singleton
+def _runner() -> BlenderCommandRunner:
+    return BlenderCommandRunner()
+
+# --- DaemonClient: one long-running CLI process instead of one per call ---
+# Same lookup as daemon_socket_path() in daemon.rs
+DAEMON_SOCKET_NAME = "text-to-face.sock"
+DAEMON_SOCKET_ENV = "TEXT_TO_FACE_SOCKET"
+
+def get_daemon_socket_path() -> str:
+    path = os.environ.get(DAEMON_SOCKET_ENV)
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, DAEMON_SOCKET_NAME)
+    return os.path.join(get_app_data_dir(), "run", DAEMON_SOCKET_NAME)
+
+# Seconds a spawned daemon may take to start listening
+DAEMON_START_TIMEOUT = 30
+
+class DaemonError(RuntimeError):
+    pass
+
+class PendingRequest:
+    """Popen-like handle for a daemon request whose response is read by poll()"""
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+        self._buffer = b""
+        self.returncode: Optional[int] = None
+        self.response: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+    def _finish(self, returncode: int, error: Optional[str] = None) -> None:
+        self.returncode = returncode
+        self.error = error
+        self._sock.close()
+    def poll(self) -> Optional[int]:
+        if self.returncode is not None:
+            return self.returncode
+        try:
+            chunk = self._sock.recv(65536)
+        except BlockingIOError:
+            return None
+        except OSError as e:
+            self._finish(1, str(e))
+            return self.returncode
+        self._buffer += chunk
+        if b"\n" not in self._buffer:
+            if not chunk:
+                self._finish(1, "Daemon closed the connection")
+            return self.returncode
+        try:
+            self.response = json_loads(self._buffer.split(b"\n", 1)[0])
+        except ValueError as e:
+            self._finish(1, f"Invalid daemon response: {e}")
+            return self.returncode
+        if self.response.get("ok"):
+            self._finish(0)
+        else:
+            self._finish(1, self.response.get("error", "Unknown daemon error"))
+        return self.returncode
+    def terminate(self) -> None:
+        if self.returncode is None:
+            self._finish(-1, "Cancelled")
+    def wait(self) -> Optional[int]:
+        # Only meaningful after terminate(); the daemon itself keeps running
+        return self.returncode
+
+class DaemonClient:
+    """JSON-over-UNIX-socket client for `text-to-face --daemon`"""
+    def __init__(self, runner: BlenderCommandRunner, socket_path: Optional[str] = None):
+        self.runner = runner
+        self.socket_path = socket_path or get_daemon_socket_path()
+        self._proc: Optional[subprocess.Popen] = None
+        # True from spawning until the first successful connect
+        self._starting = False
+        self._spawned_at = 0.0
+        self._spawn_failed = False
+        # Set once the daemon behind the socket is known to match the CLI on PATH
+        self._verified = False
+    def is_supported(self) -> bool:
+        return hasattr(socket, "AF_UNIX") and self.runner.system != "Windows"
+    def _check_socket(self) -> None:
+        # Only a socket owned by this user in a private dir, so replies can't be spoofed
+        st = os.lstat(self.socket_path)
+        dir_st = os.stat(os.path.dirname(self.socket_path))
+        uid = os.getuid()
+        if st.st_uid != uid or dir_st.st_uid != uid or dir_st.st_mode & 0o077:
+            raise DaemonError(f"Refusing to use daemon socket {self.socket_path}: not private to this user")
+    def _connect(self, timeout: float) -> socket.socket:
+        self._check_socket()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+    def reset(self) -> None:
+        # Let a daemon that failed to start be tried again (Recheck / Rescan PATH)
+        self._spawn_failed = False
+        self._verified = False
+    def _spawn(self) -> None:
+        # Non-blocking: this call falls back to the CLI, a later one connects
+        if self._proc is not None and self._starting:
+            returncode = self._proc.poll()
+            if returncode is None and time.monotonic() - self._spawned_at < DAEMON_START_TIMEOUT:
+                raise DaemonError("Daemon is starting")
+            if returncode is None:
+                # Running but never listening
+                self._proc.terminate()
+                self._spawn_failed = True
+            elif returncode != 0:
+                self._spawn_failed = True
+            # Status 0 is the idle exit: just start a new one
+        elif self._proc is not None and self._proc.poll() is None:
+            raise DaemonError("Daemon is starting")
+        self._proc = None
+        if self._spawn_failed:
+            raise DaemonError("Daemon could not be started")
+        command_path = self.runner.find_command(CLI_COMMAND)
+        if not command_path:
+            self._spawn_failed = True
+            raise DaemonError(f"Command '{CLI_COMMAND}' not found in PATH")
+        # The fallback dir may not exist yet
+        os.makedirs(os.path.dirname(self.socket_path), mode=0o700, exist_ok=True)
+        self._verified = False
+        self._proc = subprocess.Popen(
+            [command_path, "--daemon"],
+            env={**self.runner.extended_env, DAEMON_SOCKET_ENV: self.socket_path},
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        self._spawned_at = time.monotonic()
+        self._starting = True
+        raise DaemonError("Daemon is starting")
+    def _verify(self, sock: socket.socket) -> None:
+        # Stop a daemon started from another build than the CLI on PATH
+        sock.sendall(b'{"cmd": "ping"}\n')
+        with sock.makefile("rb") as f:
+            reply = json_loads(f.readline() or b"{}")
+        command_path = self.runner.find_command(CLI_COMMAND)
+        if command_path:
+            real_path = os.path.realpath(command_path)
+            try:
+                mtime_ns = os.stat(real_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if reply.get("exe") != real_path or reply.get("mtime_ns") != mtime_ns:
+                sock.sendall(b'{"cmd": "shutdown"}\n')
+                with sock.makefile("rb") as f:
+                    f.readline()
+                raise DaemonError(f"Daemon is from another build (version {reply.get('version')}); restarting it")
+        self._verified = True
+    def _send(self, payload: Dict[str, Any], timeout: float, spawn: bool) -> socket.socket:
+        if not self.is_supported():
+            raise DaemonError("Daemon is not supported on this platform")
+        try:
+            sock = self._connect(timeout)
+        except OSError:
+            if not spawn:
+                raise DaemonError("Daemon is not running")
+            # Always raises; this request falls back to the CLI
+            self._spawn()
+        self._starting = False
+        try:
+            if not self._verified:
+                self._verify(sock)
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        except (OSError, DaemonError):
+            sock.close()
+            raise
+        except ValueError as e:
+            # Malformed ping reply
+            sock.close()
+            raise DaemonError(f"Invalid daemon response: {e}") from e
+        return sock
+    # spawn=False only uses a daemon that is already running (ping, list)
+    def start_request(self, payload: Dict[str, Any], timeout: float = 5, spawn: bool = True) -> PendingRequest:
+        sock = self._send(payload, timeout, spawn)
+        sock.setblocking(False)
+        return PendingRequest(sock)
+    def request(self, payload: Dict[str, Any], timeout: float = 30, spawn: bool = True) -> Dict[str, Any]:
+        with self._send(payload, timeout, spawn) as sock:
+            with sock.makefile("rb") as f:
+                line = f.readline()
+        if not line:
+            raise DaemonError("Daemon closed the connection")
+        try:
+            response = json_loads(line)
+        except ValueError as e:
+            raise DaemonError(f"Invalid daemon response: {e}") from e
+        if not response.get("ok"):
+            raise DaemonError(response.get("error", "Unknown daemon error"))
+        return response
+    def shutdown(self) -> None:
+        if self._proc and self._proc.poll() is None:
+            self._proc.terminate()
+        self._proc = None
+
+@_singleton
+def _daemon() -> DaemonClient:
+    return DaemonClient(_runner())
+
+@_singleton
+def _executor() -> ThreadPoolExecutor:
+    # Shared background pool; its tasks must never wait on each other
+    return ThreadPoolExecutor(max_workers=3, thread_name_prefix="texttoface")
+
+@_singleton
+def _list_executor() -> ThreadPoolExecutor:
+    # Leaf pool for the voice fetch's list calls, which never wait on anything
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="texttoface-list")
+
+def _list_voices_cli(runner: BlenderCommandRunner, installed: bool) -> List[Dict[str, Any]]:
+    cmd = ["text-to-face", "list", "--json"]
+    if installed:
+        cmd.append("--installed")
+    return json_loads(runner.run_command(cmd, text=False).stdout)
+
+def _list_voices(installed: bool = False) -> List[Dict[str, Any]]:
+    try:
+        return _daemon().request({"cmd": "list", "installed": installed}, spawn=False)["voices"]
+    except (OSError, ValueError, DaemonError):
+        pass
+    return _list_voices_cli(_runner(), installed)
+
+def _list_all_and_installed_voices() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    try:
+        daemon = _daemon()
+        return (daemon.request({"cmd": "list", "installed": False}, spawn=False)["voices"],
+                daemon.request({"cmd": "list", "installed": True}, spawn=False)["voices"])
+    except (OSError, ValueError, DaemonError):
+        pass
+    # Both CLI calls at once; resolve the command first so the workers share the cache
+    runner = _runner()
+    runner.find_command(CLI_COMMAND)
+    all_future = _list_executor().submit(_list_voices_cli, runner, False)
+    installed_future = _list_executor().submit(_list_voices_cli, runner, True)
+    return all_future.result(), installed_future.result()
+
+def _start_export(text: str, voice: str, pitch: float, output: str, stderr=subprocess.DEVNULL, lipsync: str = "low"):
+    # Returns a Popen or PendingRequest to poll; stderr only applies to the CLI fallback
+    try:
+        return _daemon().start_request({"cmd": "export", "text": text, "voice": voice, "pitch": pitch,
+                                        "output": output, "lipsync": lipsync})
+    except (OSError, DaemonError):
+        pass
+    # The output is never read, so don't pipe and decode it on Blender's main thread
+    return _runner().start_command(["text-to-face", "export", text, "--voice", voice, "--output", output,
+                                    "--pitch", str(pitch), "--lipsync", lipsync],
+                                   stdout=subprocess.DEVNULL, stderr=stderr)
+
+# Probed once per session (preferences draw() would otherwise spawn the CLI every redraw)
+_CLI_AVAILABLE: Optional[bool] = None
 
 def is_cli_available():
-    return runner.test_command("text-to-face")
+    global _CLI_AVAILABLE
+    if _CLI_AVAILABLE is None:
+        _CLI_AVAILABLE = _probe_cli()
+    return _CLI_AVAILABLE
 
+def invalidate_cli_available():
+    global _CLI_AVAILABLE
+    _CLI_AVAILABLE = None
+    if _daemon.cache_info().currsize:
+        _daemon().reset()
+
+def cli_poll(cls):
+    # Greys out CLI buttons once the probe has failed; never probes (runs every redraw)
+    if _CLI_AVAILABLE is False:
+        cls.poll_message_set("Text-to-Face CLI not found; see the add-on preferences")
+        return False
+    return True
+
+def _probe_cli():
+    try:
+        _daemon().request({"cmd": "ping"}, timeout=5, spawn=False)
+        return True
+    except (OSError, ValueError, DaemonError):
+        pass
+    return _runner().test_command("text-to-face")
+
+@functools.lru_cache(maxsize=1)
 def get_app_data_dir():
-    # Match the Rust ProjectDirs logic
+    # Match the Rust ProjectDirs::from("com", "yourorg", "text-to-face").data_dir()
     home = os.path.expanduser("~")
-    if platform.system() == "Darwin":
+    if _SYSTEM == "Darwin":
         return os.path.join(home, "Library", "Application Support", "com.yourorg.text-to-face")
-    elif platform.system() == "Linux":
-        return os.path.join(home, ".local", "share", "com.yourorg.text-to-face")
-    elif platform.system() == "Windows":
-        return os.path.join(os.environ.get("APPDATA", os.path.join(home, "AppData", "Roaming")), "com.yourorg.text-to-face")
+    elif _SYSTEM == "Windows":
+        return os.path.join(os.environ.get("APPDATA", os.path.join(home, "AppData", "Roaming")), "yourorg", "text-to-face", "data")
     else:
-        return os.path.join(home, ".text-to-face")
+        # XDG on Linux and the other Unixes; a relative XDG_DATA_HOME is ignored
+        data_home = os.environ.get("XDG_DATA_HOME", "")
+        if not os.path.isabs(data_home):
+            data_home = os.path.join(home, ".local", "share")
+        return os.path.join(data_home, "text-to-face")
 
-def get_generated_wav_path(blend_filepath, voice_id, text):
+@functools.lru_cache(maxsize=64)
+def _generated_wav_path(blend_filepath, voice_id, text, pitch):
     base = os.path.splitext(os.path.basename(blend_filepath))[0] if blend_filepath else "untitled"
-    text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()[:8]
-    app_data = get_app_data_dir()
-    out_dir = os.path.join(app_data, "generated")
+    # Non-cryptographic file name key; blake2b with a 4-byte digest keeps the 8 hex chars
+    text_hash = hashlib.blake2b(text.encode("utf-8"), digest_size=4).hexdigest()
+    # Pitch is part of the key; the default pitch keeps the original name
+    pitch_suffix = "" if pitch == 1.0 else f"_p{pitch:g}"
+    filename = f"{base}_{voice_id}_{text_hash}{pitch_suffix}.wav"
+    return os.path.join(get_app_data_dir(), "generated", filename)
+
+def get_generated_wav_path(blend_filepath, voice_id, text, pitch=1.0):
+    wav_path = _generated_wav_path(blend_filepath, voice_id, text, round(pitch, 2))
+    # Not cached per session: the dir can be deleted while Blender is running
+    os.makedirs(os.path.dirname(wav_path), exist_ok=True)
+    return wav_path
+
+def _non_empty_file(path):
+    # One stat instead of isfile + getsize
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and st.st_size > 0
+
+def has_generated_output(wav_path):
+    # A previous export for the same inputs left both non-empty files behind
+    return _non_empty_file(wav_path) and _non_empty_file(wav_path[:-4] + ".json")
+
+def load_word_segments(json_path):
+    # Only word_segments is used: orjson, else ijson streaming, else stdlib json
+    with open(json_path, 'rb') as f:
+        if ijson is not None and json_loads is json.loads:
+            return list(ijson.items(f, "word_segments.item", use_float=True))
+        return json_loads(f.read()).get('word_segments', [])
+
+class TEXTTOFACE_OT_rescan_path(bpy.types.Operator):
+    bl_idname = "texttoface.rescan_path"
+    bl_label = "Rescan PATH"
+    bl_description = "Forget the cached shell PATH and command locations and search again"
+    def execute(self, context):
+        _runner().rescan()
+        invalidate_cli_available()
+        self.report({'INFO'}, "Command locations will be re-resolved.")
+        return {'FINISHED'}
+
+class TEXTTOFACE_OT_recheck_cli(bpy.types.Operator):
+    bl_idname = "texttoface.recheck_cli"
+    bl_label = "Recheck"
+    bl_description = "Check again whether the Text-to-Face CLI is available"
+    def execute(self, context):
+        invalidate_cli_available()
+        if context.area:
+            context.area.tag_redraw()
+        return {'FINISHED'}
+
+# --- Preview audio cache: identical (text, voice, pitch) previews skip synthesis ---
+PREVIEW_CACHE_MAX_BYTES = 200 * 1024 * 1024
+_PREVIEW_HANDLE = None
+
+def get_preview_cache_path(text, voice_id, pitch):
+    # Same pitch rounding as get_generated_wav_path
+    pitch = round(pitch, 2)
+    key = hashlib.sha256(f"{text}|{voice_id}|{pitch}".encode("utf-8")).hexdigest()
+    out_dir = os.path.join(get_app_data_dir(), "preview_cache")
     os.makedirs(out_dir, exist_ok=True)
-    filename = f"{base}_{voice_id}_{text_hash}.wav"
-    return os.path.join(out_dir, filename)
+    return os.path.join(out_dir, f"{key}.wav")
+
+# Renders go to a unique .part.wav (and .part.json), renamed on success
+PART_MAX_AGE = 60 * 60
+
+def get_part_path(wav_path):
+    return f"{wav_path[:-4]}.{os.urandom(4).hex()}.part.wav"
+
+def is_part_file(name):
+    return name.endswith((".part.wav", ".part.json"))
+
+def remove_part_files(part_path):
+    for path in (part_path, part_path[:-4] + ".json"):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def prune_part_files(out_dir, max_age=PART_MAX_AGE):
+    cutoff = time.time() - max_age
+    try:
+        with os.scandir(out_dir) as it:
+            stale = [entry.path for entry in it if is_part_file(entry.name) and entry.stat().st_mtime < cutoff]
+    except OSError:
+        return
+    for path in stale:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def prune_preview_cache(cache_dir, max_bytes=PREVIEW_CACHE_MAX_BYTES):
+    # Least-recently-played previews go first
+    prune_part_files(cache_dir)
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".wav") and not is_part_file(entry.name):
+                st = entry.stat()
+                entries.append((st.st_atime, st.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+def _play_sound(sound):
+    global _PREVIEW_HANDLE
+    stop_preview()
+    _PREVIEW_HANDLE = aud.Device().play(sound)
+    return _PREVIEW_HANDLE
+
+def stop_preview():
+    global _PREVIEW_HANDLE
+    if _PREVIEW_HANDLE is not None:
+        _PREVIEW_HANDLE.stop()
+        _PREVIEW_HANDLE = None
+
+def play_preview(wav_path):
+    # Mark as recently used for prune_preview_cache, even on noatime mounts
+    os.utime(wav_path)
+    return _play_sound(aud.Sound(wav_path))
+
+# --- Streaming preview: `say --output-raw` writes 16-bit mono PCM to stdout ---
+PCM_SAMPLE_RATE = 22050
+
+class PcmPlayer:
+    """Plays PCM chunks back to back as they arrive"""
+    def __init__(self):
+        self._device = aud.Device()
+        # Silent handle used as the clock for chunk start times
+        self._clock = self._device.play(aud.Sound.silence(PCM_SAMPLE_RATE))
+        self._handles = []
+        self._end = 0.0
+    def queue(self, data: bytes) -> None:
+        samples = np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+        sound = aud.Sound.buffer(samples.reshape(-1, 1), PCM_SAMPLE_RATE)
+        # Locked so the chunk starts on the sample the previous one ends
+        self._device.lock()
+        try:
+            now = self._clock.position
+            # If synthesis fell behind playback, start now rather than in the past
+            start = max(self._end, now)
+            self._handles.append(self._device.play(sound.delay(start - now)))
+        finally:
+            self._device.unlock()
+        self._end = start + len(samples) / PCM_SAMPLE_RATE
+    def finish(self) -> None:
+        # Everything is queued; the chunk handles play out on their own
+        self._clock.stop()
+    def stop(self) -> None:
+        self._clock.stop()
+        for handle in self._handles:
+            handle.stop()
+
+def start_pcm_player() -> PcmPlayer:
+    global _PREVIEW_HANDLE
+    stop_preview()
+    _PREVIEW_HANDLE = PcmPlayer()
+    return _PREVIEW_HANDLE
+
+def write_pcm_wav(path: str, data: bytes) -> None:
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(PCM_SAMPLE_RATE)
+        f.writeframes(data)
+
+class RawAudioStream:
+    """Collects PCM from a `say --output-raw` process on a background thread"""
+    def __init__(self, proc: subprocess.Popen):
+        self.proc = proc
+        self.received = bytearray()
+        self._pending = bytearray()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._read, daemon=True)
+        self._thread.start()
+    def _read(self) -> None:
+        for chunk in iter(lambda: self.proc.stdout.read1(65536), b""):
+            with self._lock:
+                self._pending += chunk
+    def take(self) -> bytes:
+        # Whole samples received since the last call
+        with self._lock:
+            n = len(self._pending) & ~1
+            data = bytes(self._pending[:n])
+            del self._pending[:n]
+        self.received += data
+        return data
+    def done(self) -> bool:
+        return not self._thread.is_alive() and self.proc.poll() is not None
+    def terminate(self) -> None:
+        if self.proc.poll() is None:
+            self.proc.terminate()
+
+def _start_say_stream(text: str, voice: str, pitch: float) -> RawAudioStream:
+    proc = _runner().start_command(["text-to-face", "say", text, "--voice", voice, "--pitch", str(pitch), "--output-raw"],
+                                   stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    return RawAudioStream(proc)
 
 class TEXTTOFACE_AddonPreferences(bpy.types.AddonPreferences):
     bl_idname = __name__
@@ -186,32 +847,224 @@ class TEXTTOFACE_AddonPreferences(bpy.types.AddonPreferences):
             layout.label(text="Text-to-Face CLI found.", icon="CHECKMARK")
         else:
             layout.label(text="Text-to-Face CLI not found! Please install it and ensure it's in your PATH.", icon="ERROR")
+        row = layout.row()
+        row.operator(TEXTTOFACE_OT_recheck_cli.bl_idname, icon="FILE_REFRESH")
+        row.operator(TEXTTOFACE_OT_rescan_path.bl_idname)
+
+def get_shape_key_fcurve(obj, key_name):
+    shape_keys = obj.data.shape_keys
+    anim = shape_keys.animation_data or shape_keys.animation_data_create()
+    if anim.action is None:
+        anim.action = bpy.data.actions.new(name=f"{shape_keys.name}Action")
+    data_path = f'key_blocks["{key_name}"].value'
+    return anim.action.fcurves.find(data_path) or anim.action.fcurves.new(data_path)
 
-def clear_viseme_keys(obj, frame_start, frame_end):
+def _get_keyframes(fcurve):
+    points = fcurve.keyframe_points
+    existing = np.empty(len(points) * 2, dtype=np.float32)
+    points.foreach_get("co", existing)
+    return existing.reshape(-1, 2)
+
+def _set_keyframes(fcurve, coords):
+    # Upsert [frame, value, ...] coords in place; the last coord per frame wins
+    coords = np.asarray(coords, dtype=np.float32).reshape(-1, 2)
+    if not len(coords):
+        fcurve.update()
+        return
+    _, last = np.unique(coords[::-1, 0], return_index=True)
+    coords = coords[::-1][last]
+    points = fcurve.keyframe_points
+    existing = _get_keyframes(fcurve)
+    hit = np.isin(coords[:, 0], existing[:, 0])
+    if hit.any():
+        order = np.argsort(existing[:, 0], kind="stable")
+        index = order[np.searchsorted(existing[order, 0], coords[hit, 0])]
+        delta = coords[hit, 1] - existing[index, 1]
+        existing[index, 1] = coords[hit, 1]
+        for attr in ("handle_left", "handle_right"):
+            handles = np.empty(len(points) * 2, dtype=np.float32)
+            points.foreach_get(attr, handles)
+            handles = handles.reshape(-1, 2)
+            handles[index, 1] += delta
+            points.foreach_set(attr, handles.ravel())
+    new = coords[~hit]
+    if len(new):
+        points.add(len(new))
+    points.foreach_set("co", np.concatenate((existing, new)).ravel())
+    # Sorts the appended keys into place and recalculates auto handles
+    fcurve.update()
+
+def replace_keyframes(fcurve, coords, frame_start, frame_end):
+    # Write coords over [frame_start, frame_end]; other keys in the range are removed
+    coords = np.asarray(coords, dtype=np.float32).reshape(-1, 2)
+    existing = _get_keyframes(fcurve)
+    frames = existing[:, 0]
+    stale = np.flatnonzero((frames >= frame_start) & (frames <= frame_end) & ~np.isin(frames, coords[:, 0]))
+    points = fcurve.keyframe_points
+    for i in stale[::-1]:
+        points.remove(points[int(i)], fast=True)
+    _set_keyframes(fcurve, coords)
+
+def insert_keyframes(fcurve, coords):
+    # Bulk-insert flat [frame, value, ...] coords, replacing existing keys on the same frames
+    _set_keyframes(fcurve, coords)
+
+def shape_key_lookup(obj) -> Dict[str, Any]:
+    # {name: key block} in one RNA traversal
+    if not obj.data.shape_keys:
+        return {}
+    return {key.name: key for key in obj.data.shape_keys.key_blocks}
+
+def clear_viseme_keys(obj, frame_start, frame_end, kb=None):
     if not obj.data.shape_keys:
         return
-    for key in obj.data.shape_keys.key_blocks:
-        if key.name.startswith("viseme_"):
-            for f in range(int(frame_start), int(frame_end)+1):
-                key.value = 0.0
-                key.keyframe_insert(data_path="value", frame=f)
+    if kb is None:
+        kb = shape_key_lookup(obj)
+    # Zero keys at both ends hold 0.0 across the range; only the fcurves are written
+    coords = np.array([int(frame_start), 0.0, int(frame_end), 0.0], dtype=np.float32)
+    for name in [name for name in kb if name.startswith("viseme_")]:
+        replace_keyframes(get_shape_key_fcurve(obj, name), coords, frame_start, frame_end)
 
-def insert_viseme(obj, viseme, frame, strength=1.0):
+def insert_viseme(obj, viseme, frame, strength=1.0, kb=None):
+    if viseme not in VALID_VISEMES or not obj.data.shape_keys:
+        return
+    # Write the key straight into the fcurve, without going through key.value
+    if (kb if kb is not None else obj.data.shape_keys.key_blocks).get(viseme) is not None:
+        insert_keyframes(get_shape_key_fcurve(obj, viseme), (frame, strength))
+
+def insert_visemes_bulk(obj, events: List[Tuple[str, int, float]], kb=None):
+    # Batched insert_viseme: one foreach_set per shape key
     if not obj.data.shape_keys:
         return
-    if viseme in obj.data.shape_keys.key_blocks:
-        key = obj.data.shape_keys.key_blocks[viseme]
-        key.value = strength
-        key.keyframe_insert(data_path="value", frame=frame)
+    key_blocks = kb if kb is not None else shape_key_lookup(obj)
+    events = [event for event in events if event[0] in VALID_VISEMES and event[0] in key_blocks]
+    if not events:
+        return
+    names = sorted({viseme for viseme, _, _ in events})
+    index = {viseme: i for i, viseme in enumerate(names)}
+    ids = np.fromiter((index[viseme] for viseme, _, _ in events), dtype=np.int64, count=len(events))
+    coords = np.array([(frame, strength) for _, frame, strength in events], dtype=np.float32)
+    # Stable sort groups keys per viseme in event order; searchsorted finds each slice
+    order = np.argsort(ids, kind="stable")
+    coords = coords[order]
+    splits = np.searchsorted(ids[order], np.arange(len(names) + 1))
+    for i, viseme in enumerate(names):
+        insert_keyframes(get_shape_key_fcurve(obj, viseme), coords[splits[i]:splits[i + 1]].ravel())
+
+# Voice list cache: the EnumProperty items callback runs on every redraw
+VOICES_CACHE_TTL = 60.0
+_VOICES_CACHE: Optional[List[Tuple[str, str, str]]] = None
+_VOICES_TS = 0.0
+# Installed voice ids from the same fetch; None when the last fetch failed
+_INSTALLED_VOICES: Optional[frozenset] = None
+
+# In-flight background fetch; a result from an older generation is discarded
+_VOICES_FUTURE = None
+_VOICES_FUTURE_GEN = 0
+_VOICES_GEN = 0
+
+def invalidate_voices(persisted=False):
+    # persisted=True also removes texttoface_voices.json
+    global _VOICES_CACHE, _VOICES_TS, _INSTALLED_VOICES, _VOICES_GEN
+    if persisted:
+        try:
+            os.remove(get_config_path(VOICES_CACHE_FILE))
+        except OSError:
+            pass
+    _VOICES_CACHE = None
+    _VOICES_TS = 0.0
+    _INSTALLED_VOICES = None
+    _VOICES_GEN += 1
+
+def get_voices(wait=True):
+    # wait=False returns the stale list (or None) while a background fetch runs
+    global _VOICES_CACHE, _VOICES_TS, _VOICES_FUTURE, _VOICES_FUTURE_GEN, _INSTALLED_VOICES
+    if _VOICES_CACHE is not None and time.monotonic() - _VOICES_TS < VOICES_CACHE_TTL:
+        return _VOICES_CACHE
+    while True:
+        if _VOICES_FUTURE is None:
+            _VOICES_FUTURE = _executor().submit(_fetch_voices)
+            _VOICES_FUTURE_GEN = _VOICES_GEN
+        if not wait and not bpy.app.timers.is_registered(_poll_voices_fetch):
+            bpy.app.timers.register(_poll_voices_fetch, first_interval=0.1)
+        if not wait and not _VOICES_FUTURE.done():
+            return _VOICES_CACHE
+        items, installed, cache_entry = _VOICES_FUTURE.result()
+        _VOICES_FUTURE = None
+        if _VOICES_FUTURE_GEN == _VOICES_GEN:
+            break
+        # Superseded by an invalidation while it ran (e.g. an export downloaded a voice)
+    _VOICES_CACHE = items
+    _INSTALLED_VOICES = installed
+    _VOICES_TS = time.monotonic()
+    if cache_entry is not None:
+        _save_json_file(get_config_path(VOICES_CACHE_FILE), cache_entry)
+    return _VOICES_CACHE
+
+def _poll_voices_fetch():
+    if _VOICES_FUTURE is None:
+        return None
+    if not _VOICES_FUTURE.done():
+        return 0.1
+    get_voices(wait=False)
+    if _VOICES_FUTURE is not None:
+        # The result was stale and a new fetch started; keep waiting for it
+        return 0.1
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            area.tag_redraw()
+    return None
+
+# EnumProperty item strings must stay referenced, so this one list is refilled in place
+_VOICE_ITEMS: List[Tuple[str, str, str]] = []
+_VOICE_ITEMS_SOURCE: Optional[List[Tuple[str, str, str]]] = None
+
+def is_voice_installed(voice_id):
+    # Trust cached hits; re-check misses in case a voice was installed outside Blender
+    get_voices()
+    if _INSTALLED_VOICES is not None and voice_id in _INSTALLED_VOICES:
+        return True
+    return voice_id in {v["id"] for v in _list_voices(installed=True)}
 
-def get_voices():
+_VOICES_LOADING = [("", "Loading voices...", "")]
+
+def voice_items(self, context):
+    global _VOICE_ITEMS_SOURCE
+    voices = get_voices(wait=False)
+    if voices is None:
+        return _VOICES_LOADING
+    if voices is not _VOICE_ITEMS_SOURCE or not _VOICE_ITEMS:
+        _VOICE_ITEMS[:] = voices or [("", "(No voices found)", "")]
+        _VOICE_ITEMS_SOURCE = voices
+    return _VOICE_ITEMS
+
+# Persisted dropdown items, reused while the CLI binary and models are unchanged
+VOICES_CACHE_FILE = "texttoface_voices.json"
+
+def _voices_cache_key() -> Optional[List[Any]]:
+    command_path = _runner().find_command(CLI_COMMAND)
+    if not command_path:
+        return None
+    key: List[Any] = [command_path]
+    for path in (command_path, os.path.join(get_app_data_dir(), "models")):
+        try:
+            st = os.stat(path)
+            key.append([st.st_mtime, st.st_size])
+        except OSError:
+            key.append(None)
+    return key
+
+def _fetch_voices():
+    # Runs on the executor without touching globals; get_voices applies the result
+    cache_path = get_config_path(VOICES_CACHE_FILE)
+    key = _voices_cache_key()
+    cached = _load_json_file(cache_path)
+    if key is not None and isinstance(cached, dict) and cached.get("key") == key:
+        return [tuple(item) for item in cached.get("items", ())], frozenset(cached.get("installed", ())), None
     try:
-        # Get all voices
-        result_all = runner.run_command(["text-to-face", "list", "--json"])
-        all_voices = json.loads(result_all.stdout)
-        # Get installed voices
-        result_installed = runner.run_command(["text-to-face", "list", "--installed", "--json"])
-        installed_voices = {v["id"] for v in json.loads(result_installed.stdout)}
+        # Get all and installed voices
+        all_voices, installed = _list_all_and_installed_voices()
+        installed_voices = frozenset(v["id"] for v in installed)
         # Build dropdown: label as (installed) or (not installed)
         items = []
         for v in all_voices:
@@ -219,15 +1072,36 @@ def get_voices():
             if v["id"] in installed_voices:
                 label += " (installed)"
             items.append((v["id"], label, ""))
-        return items
+        cache_entry = {"key": key, "items": items, "installed": sorted(installed_voices)} if key is not None else None
+        return items, installed_voices, cache_entry
     except Exception as e:
         print(f"[Text-to-Face] Failed to get voices: {e}")
-        return []
+        return [], None, None
+
+class TEXTTOFACE_OT_refresh_voices(bpy.types.Operator):
+    bl_idname = "texttoface.refresh_voices"
+    bl_label = "Refresh Voices"
+    bl_description = "Reload the voice list from the Text-to-Face CLI"
+    def execute(self, context):
+        invalidate_voices(persisted=True)
+        voices = get_voices()
+        self.report({'INFO'}, f"Found {len(voices)} voices.")
+        return {'FINISHED'}
 
 class TEXTTOFACE_OT_preview_audio(bpy.types.Operator):
     bl_idname = "texttoface.preview_audio"
     bl_label = "Preview Audio"
     bl_description = "Preview TTS audio using Rust backend"
+    _timer = None
+    _proc = None
+    _stream = None
+    _player = None
+    _request = None
+    _cache_path = None
+    _part_path = None
+    @classmethod
+    def poll(cls, context):
+        return cli_poll(cls)
     def execute(self, context):
         props = context.scene.texttoface_props
         if not props.text.strip():
@@ -236,34 +1110,145 @@ class TEXTTOFACE_OT_preview_audio(bpy.types.Operator):
         if not props.voice:
             self.report({'ERROR'}, "Select a voice!")
             return {'CANCELLED'}
+        self._cache_path = get_preview_cache_path(props.text, props.voice, props.pitch)
+        # A generated export of the same text/voice/pitch doubles as a preview
+        generated = _generated_wav_path(bpy.data.filepath, props.voice, props.text, round(props.pitch, 2))
+        for path, ready in ((self._cache_path, _non_empty_file), (generated, has_generated_output)):
+            if ready(path):
+                play_preview(path)
+                self.report({'INFO'}, "Audio previewed!")
+                return {'FINISHED'}
         # Check if selected voice is installed
         try:
-            result_installed = runner.run_command(["text-to-face", "list", "--installed", "--json"])
-            installed_voices = {v["id"] for v in json.loads(result_installed.stdout)}
-            if props.voice not in installed_voices:
+            if not is_voice_installed(props.voice):
                 self.report({'ERROR'}, "Selected voice is not installed. Please download it first.")
                 return {'CANCELLED'}
         except Exception as e:
             self.report({'ERROR'}, f"Failed to check installed voices: {e}")
             return {'CANCELLED'}
-        cmd = [
-            "text-to-face", "say",
-            props.text,
-            "--voice", props.voice,
-            "--pitch", str(props.pitch)
-        ]
+        self._part_path = get_part_path(self._cache_path)
+        self._request = (props.text, props.voice, props.pitch)
+        text, voice, pitch = self._request
+        try:
+            # A running daemon has the voice loaded already, so export there first
+            self._proc = _daemon().start_request({"cmd": "export", "text": text, "voice": voice,
+                                                  "pitch": pitch, "output": self._part_path})
+        except (OSError, DaemonError):
+            try:
+                # Otherwise stream raw PCM from `say`
+                self._stream = _start_say_stream(*self._request)
+            except Exception:
+                self._stream = None
+                try:
+                    self._proc = _start_export(*self._request, self._part_path)
+                except Exception as e:
+                    self.report({'ERROR'}, f"Failed to preview audio: {e}")
+                    return {'CANCELLED'}
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.05, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            if self._stream is not None:
+                self._stream.terminate()
+                stop_preview()
+            else:
+                self._proc.terminate()
+            self._remove_timer(context)
+            # A daemon export removes its own output once the socket is closed
+            remove_part_files(self._part_path)
+            self.report({'INFO'}, "Audio preview cancelled.")
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        if self._stream is not None:
+            return self._poll_stream(context)
+        if self._proc.poll() is not None:
+            return self._finish_export(context)
+        return {'PASS_THROUGH'}
+    def _poll_stream(self, context):
+        # Play each sentence as soon as it arrives, queued after the previous one
+        stream = self._stream
+        data = stream.take()
+        if data:
+            if self._player is None:
+                self._player = start_pcm_player()
+            self._player.queue(data)
+        if not stream.done():
+            return {'PASS_THROUGH'}
+        if stream.proc.returncode != 0 and not stream.received:
+            # CLI without --output-raw: render to a file instead
+            self._stream = None
+            try:
+                self._proc = _start_export(*self._request, self._part_path)
+            except Exception as e:
+                self._remove_timer(context)
+                self.report({'ERROR'}, f"Failed to preview audio: {e}")
+                return {'CANCELLED'}
+            return {'PASS_THROUGH'}
+        self._remove_timer(context)
+        if self._player is not None:
+            self._player.finish()
+        if stream.proc.returncode != 0:
+            self.report({'ERROR'}, f"Failed to preview audio: exit code {stream.proc.returncode}")
+            return {'CANCELLED'}
+        try:
+            write_pcm_wav(self._part_path, bytes(stream.received))
+            os.replace(self._part_path, self._cache_path)
+            prune_preview_cache(os.path.dirname(self._cache_path))
+        except Exception as e:
+            print(f"[Text-to-Face] Failed to cache preview audio: {e}")
+        self.report({'INFO'}, "Audio previewed!")
+        return {'FINISHED'}
+    def _finish_export(self, context):
+        self._remove_timer(context)
+        if self._proc.returncode != 0 or not os.path.exists(self._part_path):
+            remove_part_files(self._part_path)
+            error = getattr(self._proc, "error", None) or f"exit code {self._proc.returncode}"
+            self.report({'ERROR'}, f"Failed to preview audio: {error}")
+            return {'CANCELLED'}
         try:
-            runner.run_command(cmd)
-            self.report({'INFO'}, "Audio previewed!")
+            os.replace(self._part_path, self._cache_path)
+            play_preview(self._cache_path)
+            prune_preview_cache(os.path.dirname(self._cache_path))
         except Exception as e:
-            self.report({'ERROR'}, f"Failed to preview audio: {e}")
+            self.report({'ERROR'}, f"Failed to play preview audio: {e}")
             return {'CANCELLED'}
+        self.report({'INFO'}, "Audio previewed!")
         return {'FINISHED'}
+    def _remove_timer(self, context):
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+
+def add_sound_slice(seq, name, filepath, frame_start, frame_end, channel=1, sound=None):
+    # Sound strip trimmed to [frame_start, frame_end); pass sound to share one datablock
+    strip = seq.sequences.new_sound(name, filepath, channel, 1)
+    if sound is not None and strip.sound != sound:
+        duplicate = strip.sound
+        strip.sound = sound
+        if duplicate.users == 0:
+            bpy.data.sounds.remove(duplicate)
+    strip.frame_final_start = frame_start
+    strip.frame_final_end = frame_end
+    strip.channel = channel
+    strip.select = False
+    return strip
 
 class TEXTTOFACE_OT_generate_audio(bpy.types.Operator):
     bl_idname = "texttoface.generate_audio"
     bl_label = "Generate Audio"
     bl_description = "Generate TTS audio, load it into Blender, and auto-split for lipsync"
+    _timer = None
+    _proc = None
+    _stderr = None
+    _wav_path = None
+    _part_path = None
+    _segments = None
+    @classmethod
+    def poll(cls, context):
+        return cli_poll(cls)
     def execute(self, context):
         props = context.scene.texttoface_props
         if not props.text.strip():
@@ -273,118 +1258,145 @@ class TEXTTOFACE_OT_generate_audio(bpy.types.Operator):
             self.report({'ERROR'}, "Select a voice!")
             return {'CANCELLED'}
         blend_path = bpy.data.filepath
-        wav_path = get_generated_wav_path(blend_path, props.voice, props.text)
-        json_path = wav_path[:-4] + ".json"
-        cmd = [
-            "text-to-face", "export",
-            props.text,
-            "--voice", props.voice,
-            "--output", wav_path,
-            "--pitch", str(props.pitch)
-        ]
+        self._wav_path = get_generated_wav_path(blend_path, props.voice, props.text, props.pitch)
+        if has_generated_output(self._wav_path):
+            # Same inputs as an earlier run: reuse it
+            try:
+                return self._split(context, load_word_segments(self._wav_path[:-4] + ".json"))
+            except Exception as e:
+                self.report({'ERROR'}, f"Failed to generate/split audio: {e}")
+                return {'CANCELLED'}
+        prune_part_files(os.path.dirname(self._wav_path))
+        # Rendered under a temporary name so a cancelled run leaves nothing to reuse
+        self._part_path = get_part_path(self._wav_path)
         try:
-            runner.run_command(cmd)
-            # Add audio to the VSE timeline
-            bpy.ops.sequencer.sound_strip_add(filepath=wav_path, frame_start=1, channel=1)
-            # Find the loaded audio strip in the VSE
-            seq = context.scene.sequence_editor
-            if not seq:
-                seq = context.scene.sequence_editor_create()
-            audio_strip = None
-            for s in seq.sequences_all:
-                if s.type == 'SOUND' and s.sound and s.sound.filepath.endswith(os.path.basename(wav_path)):
-                    audio_strip = s
-                    break
-            if not audio_strip:
-                self.report({'ERROR'}, "Audio strip not found in VSE after loading.")
+            # Export in the background; stderr to a temp file so a full pipe can't stall the CLI
+            self._stderr = tempfile.TemporaryFile()
+            # _split needs word timings and phonemes, i.e. the high lipsync level
+            self._proc = _start_export(props.text, props.voice, props.pitch, self._part_path,
+                                       stderr=self._stderr, lipsync="high")
+        except Exception as e:
+            if self._stderr:
+                self._stderr.close()
+            self.report({'ERROR'}, f"Failed to generate/split audio: {e}")
+            return {'CANCELLED'}
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._proc.terminate()
+            self._proc.wait()
+            self._stderr.close()
+            self._remove_timer(context)
+            # Once the timings are being read the export is already in place
+            if self._segments is None:
+                remove_part_files(self._part_path)
+            self.report({'INFO'}, "Audio generation cancelled.")
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        if self._segments is not None:
+            if not self._segments.done():
+                return {'PASS_THROUGH'}
+            self._remove_timer(context)
+            try:
+                return self._split(context, self._segments.result())
+            except FileNotFoundError as e:
+                self.report({'ERROR'}, f"JSON timing file not found: {e.filename}")
                 return {'CANCELLED'}
-            # Parse JSON for word/phoneme timings
-            if not os.path.exists(json_path):
-                self.report({'ERROR'}, f"JSON timing file not found: {json_path}")
+            except Exception as e:
+                self.report({'ERROR'}, f"Failed to generate/split audio: {e}")
                 return {'CANCELLED'}
-            with open(json_path, 'r') as f:
-                lipsync_data = json.load(f)
-            fps = context.scene.render.fps
-            word_segments = lipsync_data.get('word_segments', [])
-            # Split at word boundaries
-            strips_by_word = []
-            for i, word in enumerate(word_segments):
-                word_start = int(round(word['start'] * fps))
-                word_end = int(round(word['end'] * fps))
-                if i == 0:
-                    audio_strip.frame_final_start = word_start
-                # Split at word_end (unless last word)
-                if i < len(word_segments) - 1:
-                    bpy.ops.sequencer.select_all(action='DESELECT')
-                    audio_strip.select = True
-                    context.scene.frame_current = word_end
-                    bpy.ops.sequencer.split(frame=word_end, type='SOFT')
-                    # After split, find the left strip (start to word_end)
-                    for s in seq.sequences_all:
-                        if s.type == 'SOUND' and s.frame_final_start == word_start and s.frame_final_end == word_end:
-                            s.name = f"word_{word['word']}"
-                            strips_by_word.append((s, word))
-                            break
-                    # Find the right strip for next iteration
-                    for s in seq.sequences_all:
-                        if s.type == 'SOUND' and s.frame_final_start == word_end:
-                            audio_strip = s
-                            break
-                else:
-                    # Last word
-                    audio_strip.name = f"word_{word['word']}"
-                    strips_by_word.append((audio_strip, word))
-            # For each word, split into phoneme segments
-            for strip, word in strips_by_word:
-                phonemes = word.get('phonemes', [])
-                n = len(phonemes)
-                if n < 2:
-                    strip.name = f"{strip.name}_ph_{phonemes[0] if phonemes else ''}"
-                    continue
-                word_start = strip.frame_final_start
-                word_end = strip.frame_final_end
-                length = word_end - word_start
-                ph_frames = [word_start + int(round(i * length / n)) for i in range(1, n)]
-                ph_strips = []
-                prev_start = word_start
-                for j, ph_frame in enumerate(ph_frames):
-                    bpy.ops.sequencer.select_all(action='DESELECT')
-                    strip.select = True
-                    context.scene.frame_current = ph_frame
-                    bpy.ops.sequencer.split(frame=ph_frame, type='SOFT')
-                    # Find left strip
-                    for s in seq.sequences_all:
-                        if s.type == 'SOUND' and s.frame_final_start == prev_start and s.frame_final_end == ph_frame:
-                            s.name = f"ph_{phonemes[j]}"
-                            ph_strips.append(s)
-                            break
-                    # Find right strip for next iteration
-                    for s in seq.sequences_all:
-                        if s.type == 'SOUND' and s.frame_final_start == ph_frame:
-                            strip = s
-                            break
-                    prev_start = ph_frame
-                # Last phoneme
-                strip.name = f"ph_{phonemes[-1]}"
-                ph_strips.append(strip)
-                # Optionally group phoneme strips into a Meta Strip
-                bpy.ops.sequencer.select_all(action='DESELECT')
-                for s in ph_strips:
-                    s.select = True
-                context.scene.frame_current = ph_strips[0].frame_final_start
-                bpy.ops.sequencer.meta_make()
-                meta = None
-                for s in seq.sequences_all:
-                    if s.type == 'META' and s.frame_final_start == ph_strips[0].frame_final_start and s.frame_final_end == ph_strips[-1].frame_final_end:
-                        meta = s
-                        break
-                if meta:
-                    meta.name = f"word_{word['word']}_meta"
-            self.report({'INFO'}, f"Audio generated, loaded, and split for lipsync: {wav_path}")
-        except Exception as e:
+        if self._proc.poll() is None:
+            return {'PASS_THROUGH'}
+        with self._stderr:
+            self._stderr.seek(0)
+            stderr = self._stderr.read().decode("utf-8", "replace").strip()
+        # Export downloads missing voices, so the voice lists may be stale
+        invalidate_voices(persisted=True)
+        if self._proc.returncode != 0:
+            error = (getattr(self._proc, "error", None) or stderr.rpartition("\n")[2].strip()
+                     or f"exit code {self._proc.returncode}")
+            self._remove_timer(context)
+            remove_part_files(self._part_path)
+            self.report({'ERROR'}, f"Failed to generate/split audio: {error}")
+            return {'CANCELLED'}
+        try:
+            # JSON first, so has_generated_output never sees a wav without timings
+            if os.path.exists(self._part_path[:-4] + ".json"):
+                os.replace(self._part_path[:-4] + ".json", self._wav_path[:-4] + ".json")
+            os.replace(self._part_path, self._wav_path)
+        except OSError as e:
+            self._remove_timer(context)
+            remove_part_files(self._part_path)
             self.report({'ERROR'}, f"Failed to generate/split audio: {e}")
             return {'CANCELLED'}
+        # Parse the timings on a worker; a later tick splits
+        self._segments = _executor().submit(load_word_segments, self._wav_path[:-4] + ".json")
+        return {'PASS_THROUGH'}
+    def _split(self, context, word_segments):
+        wav_path = self._wav_path
+        seq = context.scene.sequence_editor
+        if not seq:
+            seq = context.scene.sequence_editor_create()
+        fps = context.scene.render.fps
+        if not word_segments:
+            seq.sequences.new_sound(os.path.basename(wav_path), wav_path, 1, 1)
+        # Word frame table for the whole utterance in one numpy pass
+        starts = np.round(np.array([w['start'] for w in word_segments], dtype=np.float64) * fps).astype(np.int64)
+        ends = np.round(np.array([w['end'] for w in word_segments], dtype=np.float64) * fps).astype(np.int64)
+        # Phoneme boundaries for all words at once: start + round(j * length / n), j = 0..n
+        counts = np.array([len(w.get('phonemes', [])) for w in word_segments], dtype=np.int64)
+        widths = counts + 1
+        offsets = np.cumsum(widths) - widths
+        j = np.arange(widths.sum()) - np.repeat(offsets, widths)
+        all_bounds = (np.repeat(starts, widths)
+                      + np.round(j * np.repeat(ends - starts, widths) / np.repeat(np.maximum(counts, 1), widths)))
+        all_bounds = all_bounds.astype(np.int64).tolist()
+        # Deselect once up front
+        for s in seq.sequences_all:
+            s.select = False
+        # One trimmed strip per phoneme, all sharing one sound datablock
+        sound = None
+        for word, word_start, word_end, offset in zip(word_segments, starts.tolist(), ends.tolist(), offsets.tolist()):
+            phonemes = word.get('phonemes', [])
+            n = len(phonemes)
+            if n < 2:
+                # A strip needs at least one frame
+                if word_end > word_start:
+                    strip = add_sound_slice(seq, f"word_{word['word']}_ph_{phonemes[0] if phonemes else ''}",
+                                            wav_path, word_start, word_end, sound=sound)
+                    sound = strip.sound
+                continue
+            # Evenly spaced boundaries; zero-frame phonemes get no strip
+            bounds = all_bounds[offset:offset + n + 1]
+            ph_strips = []
+            for j, ph in enumerate(phonemes):
+                if bounds[j + 1] > bounds[j]:
+                    ph_strips.append(add_sound_slice(seq, f"ph_{ph}", wav_path, bounds[j], bounds[j + 1], sound=sound))
+                    sound = ph_strips[-1].sound
+            if not ph_strips:
+                continue
+            # Optionally group phoneme strips into a Meta Strip
+            for s in ph_strips:
+                s.select = True
+            bpy.ops.sequencer.meta_make()
+            # meta_make leaves the new meta active and selected
+            meta = seq.active_strip or next(iter(context.selected_sequences or ()), None)
+            if meta and meta.type == 'META':
+                meta.name = f"word_{word['word']}_meta"
+                meta.select = False
+            else:
+                for s in ph_strips:
+                    s.select = False
+        self.report({'INFO'}, f"Audio generated, loaded, and split for lipsync: {wav_path}")
         return {'FINISHED'}
+    def _remove_timer(self, context):
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
 
 class TEXTTOFACE_OT_export_shape_keys(bpy.types.Operator):
     bl_idname = "texttoface.export_shape_keys"
@@ -399,20 +1411,40 @@ class TEXTTOFACE_OT_export_shape_keys(bpy.types.Operator):
         if not seq:
             self.report({'ERROR'}, "No sequence editor found!")
             return {'CANCELLED'}
-        # Map ARPAbet to viseme/shape key
-        mapping = ARPABET_TO_VISEME
+        kb = shape_key_lookup(obj)
+        spans = []
         for s in seq.sequences_all:
             if s.type == 'SOUND' and s.name.startswith('ph_'):
-                ph = s.name[3:]
-                viseme = mapping.get(ph.replace('1','').replace('0',''), None)
-                if viseme and viseme in obj.data.shape_keys.key_blocks:
-                    # Insert keyframes at start and end
-                    key = obj.data.shape_keys.key_blocks[viseme]
-                    key.value = 1.0
-                    key.keyframe_insert(data_path="value", frame=s.frame_final_start)
-                    key.value = 0.0
-                    key.keyframe_insert(data_path="value", frame=s.frame_final_end)
-        self.report({'INFO'}, "Shape key keyframes exported from phoneme strips!")
+                # Drop Blender's ".001" duplicate-name suffix before the lookup
+                viseme = PHONEME_TO_VISEME.get(s.name[3:].split('.', 1)[0])
+                if viseme:
+                    spans.append((s.frame_final_start, s.frame_final_end, viseme))
+        # Add any viseme shape keys the strips need but the object lacks
+        missing = sorted({viseme for _, _, viseme in spans} - kb.keys())
+        for viseme in missing:
+            kb[viseme] = obj.shape_key_add(name=viseme, from_mix=False)
+        # Merge touching or overlapping spans per viseme so the mouth holds the shape
+        spans.sort()
+        merged = []
+        last = {}
+        for start, end, viseme in spans:
+            span = last.get(viseme)
+            if span is not None and start <= span[1]:
+                span[1] = max(span[1], end)
+            else:
+                last[viseme] = span = [start, end, viseme]
+                merged.append(span)
+        # Collect every key first and flush once per shape key curve
+        events = []
+        for start, end, viseme in merged:
+            # Keyframes at start and end
+            events.append((viseme, start, 1.0))
+            events.append((viseme, end, 0.0))
+        insert_visemes_bulk(obj, events, kb)
+        if missing:
+            self.report({'INFO'}, f"Shape key keyframes exported; added missing shape keys: {', '.join(missing)}")
+        else:
+            self.report({'INFO'}, "Shape key keyframes exported from phoneme strips!")
         return {'FINISHED'}
 
 class TEXTTOFACE_OT_load_last_audio(bpy.types.Operator):
@@ -422,7 +1454,7 @@ class TEXTTOFACE_OT_load_last_audio(bpy.types.Operator):
     def execute(self, context):
         props = context.scene.texttoface_props
         blend_path = bpy.data.filepath
-        wav_path = get_generated_wav_path(blend_path, props.voice, props.text)
+        wav_path = get_generated_wav_path(blend_path, props.voice, props.text, props.pitch)
         if os.path.exists(wav_path):
             bpy.ops.sound.open(filepath=wav_path)
             self.report({'INFO'}, f"Loaded audio: {wav_path}")
@@ -442,7 +1474,9 @@ class TEXTTOFACE_PT_panel(bpy.types.Panel):
         layout = self.layout
         props = context.scene.texttoface_props
         layout.prop(props, "text")
-        layout.prop(props, "voice")
+        row = layout.row(align=True)
+        row.prop(props, "voice")
+        row.operator(TEXTTOFACE_OT_refresh_voices.bl_idname, text="", icon="FILE_REFRESH")
         layout.prop(props, "pitch")
         layout.operator(TEXTTOFACE_OT_preview_audio.bl_idname, text="Preview Audio")
         layout.operator(TEXTTOFACE_OT_generate_audio.bl_idname, text="Generate Audio and Split for Lipsync")
@@ -459,7 +1493,7 @@ class TEXTTOFACE_Props(bpy.types.PropertyGroup):
     voice: bpy.props.EnumProperty(
         name="Voice",
         description="Voice to use",
-        items=lambda self, context: get_voices() or [("", "(No voices found)", "")],
+        items=voice_items,
     )
     pitch: bpy.props.FloatProperty(
         name="Pitch",
@@ -469,6 +1503,22 @@ class TEXTTOFACE_Props(bpy.types.PropertyGroup):
         max=2.0
     )
 
+# Voice Library listing cache, rescanned only when the dir mtime changes
+_GENERATED_WAVS: List[str] = []
+_GENERATED_MTIME: Optional[float] = None
+
+def get_generated_wavs(gen_dir):
+    global _GENERATED_WAVS, _GENERATED_MTIME
+    try:
+        mtime = os.stat(gen_dir).st_mtime
+    except OSError:
+        return []
+    if mtime != _GENERATED_MTIME:
+        with os.scandir(gen_dir) as it:
+            _GENERATED_WAVS = sorted(e.name for e in it if e.name.endswith(".wav") and not is_part_file(e.name))
+        _GENERATED_MTIME = mtime
+    return _GENERATED_WAVS
+
 class TEXTTOFACE_PT_voice_library(bpy.types.Panel):
     bl_label = "Voice Library"
     bl_idname = "TEXTTOFACE_PT_voice_library"
@@ -479,18 +1529,16 @@ class TEXTTOFACE_PT_voice_library(bpy.types.Panel):
         layout = self.layout
         app_data = get_app_data_dir()
         gen_dir = os.path.join(app_data, "generated")
-        if not os.path.exists(gen_dir):
-            layout.label(text="No generated audio found.")
-            return
-        wavs = [f for f in os.listdir(gen_dir) if f.endswith(".wav")]
+        wavs = get_generated_wavs(gen_dir)
         if not wavs:
             layout.label(text="No generated audio found.")
             return
-        for wav in sorted(wavs):
+        for wav in wavs:
             row = layout.row()
             row.label(text=wav)
             op = row.operator("texttoface.load_specific_audio", text="Load")
             op.wav_filename = wav
+        layout.operator("texttoface.clear_generated", icon="TRASH")
 
 class TEXTTOFACE_OT_load_specific_audio(bpy.types.Operator):
     bl_idname = "texttoface.load_specific_audio"
@@ -508,26 +1556,71 @@ class TEXTTOFACE_OT_load_specific_audio(bpy.types.Operator):
             self.report({'ERROR'}, "Audio file not found.")
             return {'CANCELLED'}
 
+class TEXTTOFACE_OT_clear_generated(bpy.types.Operator):
+    bl_idname = "texttoface.clear_generated"
+    bl_label = "Clear Generated Audio"
+    bl_description = "Delete all generated audio and timing files, so the next Generate runs the CLI again"
+    def invoke(self, context, event):
+        return context.window_manager.invoke_confirm(self, event)
+    def execute(self, context):
+        gen_dir = os.path.join(get_app_data_dir(), "generated")
+        removed = 0
+        try:
+            with os.scandir(gen_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith((".wav", ".json")):
+                        os.remove(entry.path)
+                        removed += 1
+        except OSError as e:
+            self.report({'ERROR'}, f"Failed to clear generated audio: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Removed {removed} generated files.")
+        return {'FINISHED'}
+
 def register():
+    invalidate_voices()
+    bpy.utils.register_class(TEXTTOFACE_OT_rescan_path)
+    bpy.utils.register_class(TEXTTOFACE_OT_recheck_cli)
     bpy.utils.register_class(TEXTTOFACE_AddonPreferences)
     bpy.utils.register_class(TEXTTOFACE_Props)
     bpy.types.Scene.texttoface_props = bpy.props.PointerProperty(type=TEXTTOFACE_Props)
     bpy.utils.register_class(TEXTTOFACE_PT_panel)
     bpy.utils.register_class(TEXTTOFACE_PT_voice_library)
+    bpy.utils.register_class(TEXTTOFACE_OT_refresh_voices)
     bpy.utils.register_class(TEXTTOFACE_OT_preview_audio)
     bpy.utils.register_class(TEXTTOFACE_OT_generate_audio)
     bpy.utils.register_class(TEXTTOFACE_OT_load_last_audio)
     bpy.utils.register_class(TEXTTOFACE_OT_load_specific_audio)
+    bpy.utils.register_class(TEXTTOFACE_OT_clear_generated)
     bpy.utils.register_class(TEXTTOFACE_OT_export_shape_keys)
+    # Warm the voice list and CLI probe in the background; neither starts the daemon
+    get_voices(wait=False)
+    _executor().submit(is_cli_available)
 
 def unregister():
+    global _VOICES_FUTURE
+    if bpy.app.timers.is_registered(_poll_voices_fetch):
+        bpy.app.timers.unregister(_poll_voices_fetch)
     bpy.utils.unregister_class(TEXTTOFACE_AddonPreferences)
+    bpy.utils.unregister_class(TEXTTOFACE_OT_recheck_cli)
+    bpy.utils.unregister_class(TEXTTOFACE_OT_rescan_path)
     bpy.utils.unregister_class(TEXTTOFACE_PT_panel)
     bpy.utils.unregister_class(TEXTTOFACE_PT_voice_library)
+    bpy.utils.unregister_class(TEXTTOFACE_OT_refresh_voices)
     bpy.utils.unregister_class(TEXTTOFACE_OT_preview_audio)
     bpy.utils.unregister_class(TEXTTOFACE_OT_generate_audio)
     bpy.utils.unregister_class(TEXTTOFACE_OT_load_last_audio)
     bpy.utils.unregister_class(TEXTTOFACE_OT_load_specific_audio)
+    bpy.utils.unregister_class(TEXTTOFACE_OT_clear_generated)
     bpy.utils.unregister_class(TEXTTOFACE_OT_export_shape_keys)
     del bpy.types.Scene.texttoface_props
-    bpy.utils.unregister_class(TEXTTOFACE_Props) 
\ No newline at end of file
+    bpy.utils.unregister_class(TEXTTOFACE_Props)
+    if _daemon.cache_info().currsize:
+        _daemon().shutdown()
+    for pool in (_executor, _list_executor):
+        if pool.cache_info().currsize:
+            pool().shutdown(wait=False, cancel_futures=True)
+            pool.cache_clear()
+    # The fetch may have been cancelled with its pool
+    _VOICES_FUTURE = None
+    invalidate_voices() 
\ No newline at end of file
@@ -0,0 +1,296 @@
+use text_to_face::{get_app_data_dir, get_available_voices, synthesize_and_handle, PitchArg, Voice};
+use serde_json::{json, Value};
+use crate::LipsyncLevel;
+use super::export::handle_export;
+use super::list::is_voice_installed;
+
+/// Socket file name shared with the Blender add-on
+pub const DAEMON_SOCKET_NAME: &str = "text-to-face.sock";
+
+/// Environment override for the socket path; the add-on sets it when it spawns the daemon
+pub const DAEMON_SOCKET_ENV: &str = "TEXT_TO_FACE_SOCKET";
+
+/// Exit after this long without a connection, so a daemon left behind by a closed
+/// or crashed Blender doesn't keep its models loaded forever
+const IDLE_TIMEOUT: std::time::Duration = std::time::Duration::from_secs(15 * 60);
+
+/// The binary this daemon was started from, reported by `ping` so a client can
+/// tell when the CLI on disk has been upgraded or rebuilt underneath it
+static BINARY_PATH: std::sync::OnceLock<String> = std::sync::OnceLock::new();
+static BINARY_MTIME_NS: std::sync::OnceLock<u64> = std::sync::OnceLock::new();
+
+/// A say/export request queued for the synthesis thread
+#[cfg(unix)]
+type Job = Box<dyn FnOnce() + Send>;
+
+/// Open connections and the time the last one closed, for the idle timeout
+#[cfg(unix)]
+struct Activity {
+    connections: std::sync::atomic::AtomicUsize,
+    last: std::sync::Mutex<std::time::Instant>,
+}
+
+#[cfg(unix)]
+impl Activity {
+    fn begin(&self) {
+        self.connections.fetch_add(1, std::sync::atomic::Ordering::SeqCst);
+    }
+    fn end(&self) {
+        *self.last.lock().unwrap_or_else(|e| e.into_inner()) = std::time::Instant::now();
+        self.connections.fetch_sub(1, std::sync::atomic::Ordering::SeqCst);
+    }
+    fn is_idle_for(&self, timeout: std::time::Duration) -> bool {
+        self.connections.load(std::sync::atomic::Ordering::SeqCst) == 0
+            && self.last.lock().unwrap_or_else(|e| e.into_inner()).elapsed() >= timeout
+    }
+}
+
+/// Socket path in a directory only this user can reach: `$TEXT_TO_FACE_SOCKET`,
+/// else `$XDG_RUNTIME_DIR`, else `run/` under the app data dir (created 0700).
+/// Never a shared directory like /tmp, where another user could bind it first.
+#[cfg(unix)]
+pub fn daemon_socket_path() -> std::io::Result<std::path::PathBuf> {
+    use std::os::unix::fs::{DirBuilderExt, PermissionsExt};
+    use std::path::PathBuf;
+
+    let path = match std::env::var_os(DAEMON_SOCKET_ENV).filter(|p| !p.is_empty()) {
+        Some(path) => PathBuf::from(path),
+        None => match std::env::var_os("XDG_RUNTIME_DIR").filter(|p| !p.is_empty()) {
+            Some(dir) => PathBuf::from(dir).join(DAEMON_SOCKET_NAME),
+            None => {
+                let dir = get_app_data_dir().join("run");
+                std::fs::DirBuilder::new().recursive(true).mode(0o700).create(&dir)?;
+                std::fs::set_permissions(&dir, std::fs::Permissions::from_mode(0o700))?;
+                dir.join(DAEMON_SOCKET_NAME)
+            }
+        },
+    };
+    let dir = path.parent().unwrap_or_else(|| std::path::Path::new("."));
+    if std::fs::metadata(dir)?.permissions().mode() & 0o077 != 0 {
+        return Err(std::io::Error::new(
+            std::io::ErrorKind::PermissionDenied,
+            format!("{} is accessible by other users", dir.display()),
+        ));
+    }
+    Ok(path)
+}
+
+/// Serve line-delimited JSON requests (`{"cmd": "say", ...}`) over a UNIX domain socket,
+/// so clients can skip process startup and model loading on every call.
+/// Exits with status 1 when it can't start listening (0 is the idle exit).
+#[cfg(unix)]
+pub fn handle_daemon() {
+    use std::os::unix::fs::MetadataExt;
+    use std::os::unix::net::{UnixListener, UnixStream};
+
+    let path = match daemon_socket_path() {
+        Ok(path) => path,
+        Err(e) => {
+            eprintln!("No private directory for the daemon socket: {}", e);
+            std::process::exit(1);
+        }
+    };
+    if let Ok(meta) = std::fs::symlink_metadata(&path) {
+        if UnixStream::connect(&path).is_ok() {
+            eprintln!("A text-to-face daemon is already listening on {}", path.display());
+            std::process::exit(1);
+        }
+        // Stale socket from a previous run, bind() would fail on it; only remove
+        // one owned by the same user as its (private) directory
+        let dir_uid = path.parent().and_then(|dir| std::fs::metadata(dir).ok()).map(|m| m.uid());
+        if dir_uid != Some(meta.uid()) {
+            eprintln!("Refusing to replace {}: it belongs to another user", path.display());
+            std::process::exit(1);
+        }
+        let _ = std::fs::remove_file(&path);
+    }
+    let listener = match UnixListener::bind(&path) {
+        Ok(listener) => listener,
+        Err(e) => {
+            eprintln!("Failed to bind daemon socket {}: {}", path.display(), e);
+            std::process::exit(1);
+        }
+    };
+    println!("text-to-face daemon listening on {}", path.display());
+    if let Ok(exe) = std::env::current_exe() {
+        let exe = std::fs::canonicalize(&exe).unwrap_or(exe);
+        let mtime = std::fs::metadata(&exe)
+            .and_then(|m| m.modified())
+            .ok()
+            .and_then(|t| t.duration_since(std::time::UNIX_EPOCH).ok());
+        if let Some(mtime) = mtime {
+            let _ = BINARY_MTIME_NS.set(mtime.as_nanos() as u64);
+        }
+        let _ = BINARY_PATH.set(exe.to_string_lossy().into_owned());
+    }
+
+    // say/export run one at a time on this thread: loaded models are cached per
+    // thread (SYNTH_CACHE), so keeping synthesis here reuses them across connections
+    let (jobs, queue) = std::sync::mpsc::channel::<Job>();
+    std::thread::spawn(move || {
+        for job in queue {
+            if std::panic::catch_unwind(std::panic::AssertUnwindSafe(job)).is_err() {
+                eprintln!("[Daemon] Synthesis job panicked");
+            }
+        }
+    });
+
+    let activity = std::sync::Arc::new(Activity {
+        connections: std::sync::atomic::AtomicUsize::new(0),
+        last: std::sync::Mutex::new(std::time::Instant::now()),
+    });
+    {
+        let activity = activity.clone();
+        let path = path.clone();
+        std::thread::spawn(move || loop {
+            std::thread::sleep(std::time::Duration::from_secs(30));
+            if activity.is_idle_for(IDLE_TIMEOUT) {
+                println!("[Daemon] No connections for {:?}, exiting", IDLE_TIMEOUT);
+                let _ = std::fs::remove_file(&path);
+                std::process::exit(0);
+            }
+        });
+    }
+
+    for stream in listener.incoming() {
+        match stream {
+            Ok(stream) => {
+                // A thread per connection, so ping/list answer while an export is running
+                let jobs = jobs.clone();
+                let activity = activity.clone();
+                let path = path.clone();
+                activity.begin();
+                std::thread::spawn(move || {
+                    if let Err(e) = handle_connection(stream, &jobs, &path) {
+                        eprintln!("[Daemon] Connection error: {}", e);
+                    }
+                    activity.end();
+                });
+            }
+            Err(e) => eprintln!("[Daemon] Failed to accept connection: {}", e),
+        }
+    }
+}
+
+#[cfg(not(unix))]
+pub fn handle_daemon() {
+    eprintln!("The text-to-face daemon is only supported on Unix platforms.");
+}
+
+#[cfg(unix)]
+fn handle_connection(
+    stream: std::os::unix::net::UnixStream,
+    jobs: &std::sync::mpsc::Sender<Job>,
+    socket: &std::path::Path,
+) -> std::io::Result<()> {
+    use std::io::{BufRead, BufReader, Write};
+
+    let mut reader = BufReader::new(stream.try_clone()?);
+    let mut writer = stream;
+    let mut line = String::new();
+    while reader.read_line(&mut line)? > 0 {
+        // Where an export writes, so it can be removed if the client is gone by the end
+        let mut output = None;
+        let response = match serde_json::from_str::<Value>(&line) {
+            Ok(request) => {
+                let cmd = request.get("cmd").and_then(Value::as_str).map(str::to_owned);
+                match cmd.as_deref() {
+                    Some("shutdown") => {
+                        // Free the socket path before replying, so a replacement daemon
+                        // started by the client right after can bind it
+                        let _ = std::fs::remove_file(socket);
+                        writeln!(writer, "{}", json!({ "ok": true }))?;
+                        std::process::exit(0);
+                    }
+                    Some("say" | "export") => {
+                        output = request.get("output").and_then(Value::as_str).map(std::path::PathBuf::from);
+                        run_on_synth_thread(jobs, request)
+                    }
+                    _ => handle_request(&request),
+                }
+            }
+            Err(e) => json!({ "ok": false, "error": format!("Invalid request: {}", e) }),
+        };
+        if let Err(e) = writeln!(writer, "{}", response) {
+            // The client cancelled (closed the socket) while the export ran. Synthesis
+            // can't be interrupted, but its files shouldn't outlive the request
+            if let Some(output) = output {
+                let _ = std::fs::remove_file(output.with_extension("json"));
+                let _ = std::fs::remove_file(output);
+            }
+            return Err(e);
+        }
+        line.clear();
+    }
+    Ok(())
+}
+
+/// Queue a request on the synthesis thread and wait for its response
+#[cfg(unix)]
+fn run_on_synth_thread(jobs: &std::sync::mpsc::Sender<Job>, request: Value) -> Value {
+    let (reply, response) = std::sync::mpsc::channel();
+    let job: Job = Box::new(move || {
+        let _ = reply.send(handle_request(&request));
+    });
+    if jobs.send(job).is_err() {
+        return json!({ "ok": false, "error": "Synthesis thread is not running" });
+    }
+    response
+        .recv()
+        .unwrap_or_else(|_| json!({ "ok": false, "error": "Synthesis failed" }))
+}
+
+fn handle_request(request: &Value) -> Value {
+    match request.get("cmd").and_then(Value::as_str) {
+        Some("ping") => json!({
+            "ok": true,
+            "version": env!("CARGO_PKG_VERSION"),
+            "exe": BINARY_PATH.get(),
+            "mtime_ns": BINARY_MTIME_NS.get(),
+        }),
+        Some("list") => {
+            let installed = request.get("installed").and_then(Value::as_bool).unwrap_or(false);
+            let voices: Vec<Voice> = get_available_voices()
+                .into_iter()
+                .filter(|v| !installed || is_voice_installed(v))
+                .collect();
+            json!({ "ok": true, "voices": voices })
+        }
+        Some(cmd @ ("say" | "export")) => {
+            let text = match request.get("text").and_then(Value::as_str) {
+                Some(text) => text,
+                None => return json!({ "ok": false, "error": "Missing 'text'" }),
+            };
+            // `say` plays the audio, `export` writes it to `output`
+            let output = if cmd == "export" {
+                match request.get("output").and_then(Value::as_str) {
+                    Some(output) => Some(output),
+                    None => return json!({ "ok": false, "error": "Missing 'output'" }),
+                }
+            } else {
+                None
+            };
+            let voice = request.get("voice").and_then(Value::as_str).unwrap_or("en_GB-alba-medium");
+            let pitch = PitchArg::Value(request.get("pitch").and_then(Value::as_f64).unwrap_or(1.0) as f32);
+            let tempo = request.get("tempo").and_then(Value::as_f64).unwrap_or(1.0) as f32;
+            let lipsync = match request.get("lipsync").and_then(Value::as_str) {
+                Some(level) => match <LipsyncLevel as clap::ValueEnum>::from_str(level, true) {
+                    Ok(level) => level,
+                    Err(e) => return json!({ "ok": false, "error": format!("Invalid 'lipsync': {}", e) }),
+                },
+                None => LipsyncLevel::Low,
+            };
+            let result = match output {
+                // Same path as `text-to-face export`, so the lipsync JSON lands next to the WAV
+                Some(output) => handle_export(voice, Some(output), text, &pitch, tempo, lipsync, "", None),
+                None => synthesize_and_handle(text, voice, &pitch, tempo, None, true, LipsyncLevel::Low, None, None),
+            };
+            match result {
+                Ok(()) => json!({ "ok": true }),
+                Err(e) => json!({ "ok": false, "error": e.to_string() }),
+            }
+        }
+        Some(other) => json!({ "ok": false, "error": format!("Unknown command: {}", other) }),
+        None => json!({ "ok": false, "error": "Missing 'cmd'" }),
+    }
+}
@@ -3,7 +3,7 @@ use std::fs;
 use std::path::Path;
 use crate::LipsyncLevel;
 
-pub fn handle_export(voice: &str, output: Option<&str>, text: &str, pitch: &PitchArg, tempo: f32, lipsync: LipsyncLevel, json_output: &str, lipsync_with_llm: Option<String>) {
+pub fn handle_export(voice: &str, output: Option<&str>, text: &str, pitch: &PitchArg, tempo: f32, lipsync: LipsyncLevel, json_output: &str, lipsync_with_llm: Option<String>) -> Result<(), Box<dyn std::error::Error>> {
     use std::path::PathBuf;
     let (wav_path, json_path): (PathBuf, PathBuf) = if let Some(path) = output {
         let p = Path::new(path);
@@ -35,23 +35,24 @@ pub fn handle_export(voice: &str, output: Option<&str>, text: &str, pitch: &Pitc
     if let Some(parent) = wav_path.parent() {
         if !parent.exists() {
             if let Err(e) = fs::create_dir_all(parent) {
-                eprintln!("Failed to create output directory: {}", e);
-                return;
+                return Err(format!("Failed to create output directory: {}", e).into());
             }
         }
     }
     println!("Exporting voice: {} to {:?} (pitch: {}, tempo: {})", voice, wav_path, pitch.as_factor(), tempo);
+    let wav_path = wav_path.to_str().ok_or("Output path is not valid UTF-8")?;
+    let json_path = json_path.to_str().ok_or("Lipsync JSON path is not valid UTF-8")?;
     synthesize_and_handle(
         text,
         voice,
         pitch,
         tempo,
-        Some(wav_path.to_str().unwrap()), // Output WAV file
+        Some(wav_path), // Output WAV file
         false, // Do not play audio
         lipsync,
-        if lipsync != LipsyncLevel::Low { Some(json_path.to_str().unwrap()) } else { None },
+        if lipsync != LipsyncLevel::Low { Some(json_path) } else { None },
         lipsync_with_llm.as_deref(),
-    );
+    )
 }
 
 /// Clean a string for use as a folder name (alphanumeric and underscores only)
@@ -2,7 +2,7 @@ use text_to_face::{get_available_voices, get_voices_by_language, get_models_dir,
 use serde_json;
 use std::fs;
 
-fn is_voice_installed(voice: &Voice) -> bool {
+pub fn is_voice_installed(voice: &Voice) -> bool {
     let models_dir = get_models_dir();
     let model_path = models_dir.join(format!("{}.onnx", voice.id));
     let config_path = models_dir.join(format!("{}.onnx.json", voice.id));
@@ -1,9 +1,18 @@
-use text_to_face::{PitchArg, synthesize_and_handle};
+use text_to_face::{PitchArg, synthesize_and_handle, synth_to_raw_stream};
 use crate::LipsyncLevel;
 
-pub fn handle_say(voice: &str, text: &str, pitch: &PitchArg, tempo: f32, lipsync: LipsyncLevel) {
+pub fn handle_say(voice: &str, text: &str, pitch: &PitchArg, tempo: f32, lipsync: LipsyncLevel, output_raw: bool) {
+    if output_raw {
+        // stdout carries the PCM stream, so status goes to stderr
+        eprintln!("Streaming voice: {} (pitch: {})", voice, pitch.as_factor());
+        if let Err(e) = synth_to_raw_stream(text, voice, pitch, tempo, &mut std::io::stdout().lock()) {
+            eprintln!("Error: {}", e);
+            std::process::exit(1);
+        }
+        return;
+    }
     println!("Playing voice: {} (pitch: {})", voice, pitch.as_factor());
-    synthesize_and_handle(
+    if let Err(e) = synthesize_and_handle(
         text,
         voice,
         pitch,
@@ -13,5 +22,8 @@ pub fn handle_say(voice: &str, text: &str, pitch: &PitchArg, tempo: f32, lipsync
         lipsync,
         None, // Print lipsync JSON to terminal if lipsync is true
         None, // lipsync_with_llm: not used in 'say' command
-    );
+    ) {
+        eprintln!("Error: {}", e);
+        std::process::exit(1);
+    }
 } 
\ No newline at end of file
@@ -1,4 +1,5 @@
 use clap::{Parser, Subcommand};
+use commands::daemon::handle_daemon;
 use commands::export::handle_export;
 use commands::list::handle_list;
 use commands::say::handle_say;
@@ -28,6 +29,10 @@ struct Cli {
     /// Pitch factor or preset (e.g. 1.2, slomo, deep, child, helium)
     #[arg(long, value_parser = PitchArg::from_str, help = "Pitch factor (0.5 = octave down, 2.0 = octave up) or preset (slomo, deep, child, helium)")]
     pitch: Option<PitchArg>,
+
+    /// Run as a background daemon serving JSON requests over a local socket
+    #[arg(long, hide = true)]
+    daemon: bool,
 }
 
 #[derive(Subcommand)]
@@ -69,6 +74,10 @@ enum Commands {
         /// Lipsync level: low (default) or high (adds ARPAbet phonemes)
         #[arg(long, value_enum, default_value = "low")]
         lipsync: LipsyncLevel,
+
+        /// Stream raw 16-bit mono PCM (22050 Hz) to stdout instead of playing it
+        #[arg(long)]
+        output_raw: bool,
     },
     
     /// Export speech to WAV file
@@ -124,14 +133,24 @@ mod commands {
     pub mod list;
     pub mod say;
     pub mod export;
+    pub mod daemon;
 }
 
 fn main() {
     let cli = Cli::parse();
+    if cli.daemon {
+        handle_daemon();
+        return;
+    }
     match &cli.command {
         Some(Commands::List { by_language, json, installed, not_installed }) => handle_list(*by_language, *json, *installed, *not_installed),
-        Some(Commands::Say { voice, text, pitch, tempo, lipsync }) => handle_say(voice, text, pitch, *tempo, *lipsync),
-        Some(Commands::Export { voice, output, text, pitch, tempo, lipsync, json_output, lipsync_with_llm }) => handle_export(voice, output.as_deref(), text, pitch, *tempo, *lipsync, json_output, lipsync_with_llm.clone()),
+        Some(Commands::Say { voice, text, pitch, tempo, lipsync, output_raw }) => handle_say(voice, text, pitch, *tempo, *lipsync, *output_raw),
+        Some(Commands::Export { voice, output, text, pitch, tempo, lipsync, json_output, lipsync_with_llm }) => {
+            if let Err(e) = handle_export(voice, output.as_deref(), text, pitch, *tempo, *lipsync, json_output, lipsync_with_llm.clone()) {
+                eprintln!("Error: {}", e);
+                std::process::exit(1);
+            }
+        }
         Some(Commands::Info) => print_info(),
         None => {
             // Show help by default instead of playing audio
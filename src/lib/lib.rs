@@ -3,6 +3,8 @@ use std::fs;
 use std::process::Command;
 use std::path::Path;
 use std::collections::HashMap;
+use std::cell::RefCell;
+use std::rc::Rc;
 use once_cell::sync::Lazy;
 use serde::{Serialize, Deserialize};
 use rubato::{FftFixedIn, Resampler};
@@ -525,7 +527,7 @@ pub fn get_voices_by_language() -> HashMap<String, Vec<Voice>> {
 pub fn download_voice_files(voice: &Voice) -> Result<(String, String), Box<dyn std::error::Error>> {
     let models_dir = get_models_dir();
     let log_msg = format!("[text-to-face] Using models directory: {}", models_dir.display());
-    println!("{}", log_msg);
+    eprintln!("{}", log_msg);
     log_to_file(&log_msg);
     if !models_dir.exists() {
         fs::create_dir_all(&models_dir)?;
@@ -537,32 +539,41 @@ pub fn download_voice_files(voice: &Voice) -> Result<(String, String), Box<dyn s
     let config_path = models_dir.join(&config_filename);
 
     if !model_path.exists() {
-        println!("{} voice model...", voice.display_name.yellow());
+        eprintln!("{} voice model...", voice.display_name.yellow());
         let output = Command::new("curl")
             .arg("-L").arg("-o").arg(&model_path).arg(&voice.model_path)
             .output()?;
         if !output.status.success() {
             return Err(format!("Failed to download {}: {}", voice.display_name, String::from_utf8_lossy(&output.stderr)).into());
         }
-        println!("{}", "Successfully downloaded".green());
+        eprintln!("{}", "Successfully downloaded".green());
     }
     
     if !config_path.exists() {
-        println!("{} config...", voice.display_name.yellow());
+        eprintln!("{} config...", voice.display_name.yellow());
         let output = Command::new("curl")
             .arg("-L").arg("-o").arg(&config_path).arg(&voice.config_path)
             .output()?;
         if !output.status.success() {
             return Err(format!("Failed to download config for {}: {}", voice.display_name, String::from_utf8_lossy(&output.stderr)).into());
         }
-        println!("{}", "Successfully downloaded config for".green());
+        eprintln!("{}", "Successfully downloaded config for".green());
     }
     
     Ok((model_path.to_string_lossy().to_string(), config_path.to_string_lossy().to_string()))
 }
 
-/// Synthesize speech with a specific voice
-pub fn synth_with_voice_config(text: String, voice_id: &str) -> Result<Vec<f32>, Box<dyn std::error::Error>> {
+// Loaded synthesizers keyed by voice ID, so long-running processes (the daemon)
+// only pay the model load once per voice
+thread_local! {
+    static SYNTH_CACHE: RefCell<HashMap<String, Rc<PiperSpeechSynthesizer>>> = RefCell::new(HashMap::new());
+}
+
+/// Load (or reuse) the synthesizer for a voice, downloading its model if needed
+fn get_synthesizer(voice_id: &str) -> Result<Rc<PiperSpeechSynthesizer>, Box<dyn std::error::Error>> {
+    if let Some(synth) = SYNTH_CACHE.with(|cache| cache.borrow().get(voice_id).cloned()) {
+        return Ok(synth);
+    }
     let voices = get_available_voices();
     let voice = voices.iter()
         .find(|v| v.id == voice_id)
@@ -573,7 +584,14 @@ pub fn synth_with_voice_config(text: String, voice_id: &str) -> Result<Vec<f32>,
     
     let (_model_path, config_path) = download_voice_files(voice)?;
     let model = piper_rs::from_config_path(config_path.as_ref())?;
-    let synth = PiperSpeechSynthesizer::new(model)?;
+    let synth = Rc::new(PiperSpeechSynthesizer::new(model)?);
+    SYNTH_CACHE.with(|cache| cache.borrow_mut().insert(voice_id.to_string(), synth.clone()));
+    Ok(synth)
+}
+
+/// Synthesize speech with a specific voice
+pub fn synth_with_voice_config(text: String, voice_id: &str) -> Result<Vec<f32>, Box<dyn std::error::Error>> {
+    let synth = get_synthesizer(voice_id)?;
     
     let mut samples: Vec<f32> = Vec::new();
     let audio = synth.synthesize_parallel(text, None)?;
@@ -584,6 +602,26 @@ pub fn synth_with_voice_config(text: String, voice_id: &str) -> Result<Vec<f32>,
     Ok(samples)
 }
 
+/// Stream speech as raw 16-bit little-endian mono PCM (22050 Hz), writing each
+/// synthesized sentence as soon as it is ready so playback can start early
+pub fn synth_to_raw_stream<W: Write>(text: &str, voice_id: &str, pitch: &PitchArg, tempo: f32, out: &mut W) -> Result<(), Box<dyn std::error::Error>> {
+    let synth = get_synthesizer(voice_id)?;
+    let pitch_factor = pitch.as_factor();
+    for result in synth.synthesize_lazy(text.to_string(), None)? {
+        let samples = result?.into_vec();
+        let processed_samples = true_pitch_shift(&samples, 22050, pitch_factor);
+        let processed_samples = time_stretch(&processed_samples, 22050, tempo);
+        let mut bytes = Vec::with_capacity(processed_samples.len() * 2);
+        for sample in processed_samples {
+            let sample_i16 = (sample * 32767.0).clamp(-32768.0, 32767.0) as i16;
+            bytes.extend_from_slice(&sample_i16.to_le_bytes());
+        }
+        out.write_all(&bytes)?;
+        out.flush()?;
+    }
+    Ok(())
+}
+
 /// Synthesize speech to WAV file with pitch shifting and tempo adjustment
 pub fn synth_to_wav_with_pitch(text: String, voice_id: &str, output_path: &str, pitch_factor: f32, tempo: f32) -> Result<(), Box<dyn std::error::Error>> {
     // Get the raw audio samples
@@ -624,16 +662,9 @@ pub fn synthesize_and_handle(
     lipsync: LipsyncLevel,
     lipsync_json: Option<&str>,
     lipsync_with_llm: Option<&str>,
-) {
+) -> Result<(), Box<dyn std::error::Error>> {
     let pitch_factor = pitch.as_factor();
-    let samples = match synth_with_voice_config(text.to_string(), voice) {
-        Ok(samples) => samples,
-        Err(e) => {
-            eprintln!("{}", "Error:".red());
-            eprintln!("{}", e);
-            return;
-        }
-    };
+    let samples = synth_with_voice_config(text.to_string(), voice)?;
     // Use high-quality pitch shift
     let processed_samples = true_pitch_shift(&samples, 22050, pitch_factor);
     let processed_samples = time_stretch(&processed_samples, 22050, tempo);
@@ -646,12 +677,12 @@ pub fn synthesize_and_handle(
             bits_per_sample: 16,
             sample_format: hound::SampleFormat::Int,
         };
-        let mut writer = hound::WavWriter::create(wav_path, spec).unwrap();
+        let mut writer = hound::WavWriter::create(wav_path, spec)?;
         for sample in &processed_samples {
             let sample_i16 = (*sample * 32767.0).clamp(-32768.0, 32767.0) as i16;
-            writer.write_sample(sample_i16).unwrap();
+            writer.write_sample(sample_i16)?;
         }
-        writer.finalize().unwrap();
+        writer.finalize()?;
         println!("{} file written to {} with pitch factor {} and tempo {}", "WAV".green(), wav_path, pitch_factor, tempo);
     }
 
@@ -679,23 +710,25 @@ pub fn synthesize_and_handle(
                 bits_per_sample: 16,
                 sample_format: hound::SampleFormat::Int,
             };
-            let mut writer = hound::WavWriter::create(temp_wav, spec).unwrap();
+            let mut writer = hound::WavWriter::create(temp_wav, spec)?;
             for sample in &processed_samples {
                 let sample_i16 = (*sample * 32767.0).clamp(-32768.0, 32767.0) as i16;
-                writer.write_sample(sample_i16).unwrap();
+                writer.write_sample(sample_i16)?;
             }
-            writer.finalize().unwrap();
+            writer.finalize()?;
             temp_wav
         };
-        run_whisperx_on_wav(wav_path, lipsync_json, lipsync == LipsyncLevel::High, text, lipsync_with_llm);
+        let result = run_whisperx_on_wav(wav_path, lipsync_json, lipsync == LipsyncLevel::High, text, lipsync_with_llm);
         if output_wav.is_none() {
             let _ = std::fs::remove_file(wav_path);
         }
+        result?;
     }
+    Ok(())
 } 
 
 /// Run WhisperX on a WAV file, optionally saving output JSON to a file or printing it.
-pub fn run_whisperx_on_wav(wav_path: &str, output_json: Option<&str>, hi_fidelity: bool, text: &str, lipsync_with_llm: Option<&str>) {
+pub fn run_whisperx_on_wav(wav_path: &str, output_json: Option<&str>, hi_fidelity: bool, text: &str, lipsync_with_llm: Option<&str>) -> Result<(), Box<dyn std::error::Error>> {
     use std::env;
     use serde_json::Value;
     // Check for whisperx
@@ -708,7 +741,7 @@ pub fn run_whisperx_on_wav(wav_path: &str, output_json: Option<&str>, hi_fidelit
         eprintln!("{} To use the --lipsync flag, you must install WhisperX:", "[WhisperX]".red());
         eprintln!("  python3 -m pip install git+https://github.com/m-bain/whisperx.git");
         eprintln!("{} See: https://github.com/m-bain/whisperX\n", "[WhisperX]".red());
-        return;
+        return Err("'whisperx' executable not found in your PATH".into());
     }
 
     // If output_json is provided, change to its directory
@@ -729,7 +762,7 @@ pub fn run_whisperx_on_wav(wav_path: &str, output_json: Option<&str>, hi_fidelit
     if let Some(ref dir) = run_dir {
         if let Err(e) = env::set_current_dir(dir) {
             eprintln!("{} Failed to change directory to {}: {}", "[WhisperX]".red(), dir, e);
-            return;
+            return Err(format!("Failed to change directory to {}: {}", dir, e).into());
         }
     }
 
@@ -744,7 +777,7 @@ pub fn run_whisperx_on_wav(wav_path: &str, output_json: Option<&str>, hi_fidelit
         .arg("--compute_type")
         .arg("float32")
         .output();
-    match whisperx_result {
+    let outcome: Result<(), Box<dyn std::error::Error>> = 'run: { match whisperx_result {
         Ok(result) => {
             println!("{} Command stdout: {}", "[WhisperX]".cyan(), String::from_utf8_lossy(&result.stdout));
             println!("{} Command stderr: {}", "[WhisperX]".red(), String::from_utf8_lossy(&result.stderr));
@@ -773,11 +806,7 @@ pub fn run_whisperx_on_wav(wav_path: &str, output_json: Option<&str>, hi_fidelit
                             }
                         }
                     }
-                    // Restore directory before returning
-                    if let Some(ref orig) = restore_dir {
-                        let _ = env::set_current_dir(orig);
-                    }
-                    return;
+                    break 'run Err(format!("WhisperX output JSON not found: {}", whisperx_json_path).into());
                 }
                 match json_filename {
                     Some(ref json_path) => {
@@ -790,6 +819,7 @@ pub fn run_whisperx_on_wav(wav_path: &str, output_json: Option<&str>, hi_fidelit
                                 Err(_e) => {
                                     if let Err(copy_err) = std::fs::copy(&whisperx_json_path, json_path) {
                                         eprintln!("{} Failed to copy WhisperX output: {}", "[WhisperX]".red(), copy_err);
+                                        break 'run Err(format!("Failed to copy WhisperX output: {}", copy_err).into());
                                     } else if let Err(remove_err) = std::fs::remove_file(&whisperx_json_path) {
                                         eprintln!("{} Failed to remove original WhisperX output: {}", "[WhisperX]".red(), remove_err);
                                     } else {
@@ -828,11 +858,20 @@ pub fn run_whisperx_on_wav(wav_path: &str, output_json: Option<&str>, hi_fidelit
                                 }
                             }
                             
-                            let _ = std::fs::write(json_path, serde_json::to_string_pretty(&json_value).unwrap());
+                            let pretty = match serde_json::to_string_pretty(&json_value) {
+                                Ok(pretty) => pretty,
+                                Err(e) => break 'run Err(e.into()),
+                            };
+                            if let Err(e) = std::fs::write(json_path, pretty) {
+                                break 'run Err(format!("Failed to write {}: {}", json_path, e).into());
+                            }
                             println!("{} Added ARPAbet phonemes to word segments in {}", "[HiFidelity]".cyan(), json_path);
+                        } else {
+                            break 'run Err(format!("Failed to read WhisperX output {}", json_path).into());
                         }
                     }
                 }
+                Ok(())
             }
             else {
                 eprintln!(
@@ -841,14 +880,17 @@ pub fn run_whisperx_on_wav(wav_path: &str, output_json: Option<&str>, hi_fidelit
                     result.status,
                     String::from_utf8_lossy(&result.stderr)
                 );
+                Err(format!("WhisperX failed with status {}", result.status).into())
             }
         }
         Err(e) => {
             eprintln!("{} Failed to run WhisperX: {}", "[WhisperX]".red(), e);
+            Err(format!("Failed to run WhisperX: {}", e).into())
         }
-    }
+    } };
     // Restore original directory if changed
     if let Some(ref orig) = restore_dir {
         let _ = env::set_current_dir(orig);
     }
+    outcome
 } 
\ No newline at end of file
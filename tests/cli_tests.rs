@@ -153,6 +153,32 @@ fn test_cli_say_with_pitch() {
     }
 }
 
+#[test]
+fn test_cli_say_output_raw() {
+    // Test say --output-raw streams 16-bit PCM to stdout instead of playing it
+    let mut cmd = Command::new("cargo");
+    cmd.args(["run", "--", "say", "Raw stream test", "--output-raw"]);
+    
+    let output = cmd.output();
+    
+    match output {
+        Ok(result) => {
+            assert!(result.status.success(), "Say --output-raw should succeed");
+            
+            let stderr = String::from_utf8_lossy(&result.stderr);
+            
+            // Status goes to stderr so stdout carries only samples
+            assert!(stderr.contains("Streaming voice"), "Should show voice information on stderr");
+            assert!(!result.stdout.is_empty(), "Should write PCM to stdout");
+            assert_eq!(result.stdout.len() % 2, 0, "Should write whole 16-bit samples");
+            assert!(!String::from_utf8_lossy(&result.stdout).contains("Playing voice"), "Should not print status to stdout");
+        }
+        Err(e) => {
+            eprintln!("CLI say --output-raw test failed: {}", e);
+        }
+    }
+}
+
 #[test]
 fn test_cli_list_command() {
     // Test the list command
@@ -249,6 +275,78 @@ fn test_cli_legacy_mode() {
     }
 }
 
+// Spawns the hidden --daemon mode on a private socket and talks to it like the Blender add-on
+#[cfg(unix)]
+#[test]
+fn test_cli_daemon_ping_export_shutdown() {
+    use std::io::{BufRead, BufReader, Write};
+    use std::os::unix::fs::{DirBuilderExt, MetadataExt};
+    use std::os::unix::net::UnixStream;
+
+    let dir = std::env::temp_dir().join(format!("text-to-face-daemon-test-{}", std::process::id()));
+    let _ = std::fs::remove_dir_all(&dir);
+    std::fs::DirBuilder::new().mode(0o700).create(&dir).expect("Should create a private socket dir");
+    let socket = dir.join("daemon.sock");
+    let exe = env!("CARGO_BIN_EXE_text-to-face");
+
+    let mut daemon = Command::new(exe)
+        .arg("--daemon")
+        .env("TEXT_TO_FACE_SOCKET", &socket)
+        .spawn()
+        .expect("Should spawn the daemon");
+
+    // Wait for it to start listening
+    let mut stream = None;
+    for _ in 0..100 {
+        if let Ok(s) = UnixStream::connect(&socket) {
+            stream = Some(s);
+            break;
+        }
+        assert!(daemon.try_wait().unwrap().is_none(), "Daemon exited before listening");
+        thread::sleep(Duration::from_millis(100));
+    }
+    let stream = stream.expect("Daemon should listen on the socket");
+    let mut reader = BufReader::new(stream.try_clone().unwrap());
+    let mut writer = stream;
+    let mut send = |request: serde_json::Value| -> serde_json::Value {
+        writeln!(writer, "{}", request).unwrap();
+        let mut line = String::new();
+        reader.read_line(&mut line).unwrap();
+        serde_json::from_str(&line).expect("Daemon should reply with one JSON line")
+    };
+
+    // ping reports the binary it runs from, which clients compare with the CLI on PATH
+    let ping = send(serde_json::json!({ "cmd": "ping" }));
+    assert_eq!(ping["ok"], true, "ping should succeed: {}", ping);
+    assert_eq!(ping["version"], env!("CARGO_PKG_VERSION"));
+    let real_exe = std::fs::canonicalize(exe).unwrap();
+    assert_eq!(ping["exe"], real_exe.to_str().unwrap(), "ping should report the daemon binary");
+    let mtime = std::fs::metadata(&real_exe).unwrap();
+    let mtime_ns = mtime.mtime() as u64 * 1_000_000_000 + mtime.mtime_nsec() as u64;
+    assert_eq!(ping["mtime_ns"], mtime_ns, "ping should report the binary's mtime");
+
+    let bad = send(serde_json::json!({ "cmd": "export", "text": "No output" }));
+    assert_eq!(bad["ok"], false, "export without an output should fail");
+    assert!(bad["error"].as_str().unwrap_or("").contains("output"));
+
+    let wav = dir.join("daemon_export.wav");
+    let export = send(serde_json::json!({
+        "cmd": "export",
+        "text": "Daemon export test",
+        "voice": "en_GB-alba-medium",
+        "output": wav.to_str().unwrap(),
+    }));
+    assert_eq!(export["ok"], true, "export should succeed: {}", export);
+    assert!(std::fs::metadata(&wav).map(|m| m.len() > 44).unwrap_or(false), "export should write a WAV with samples");
+
+    let shutdown = send(serde_json::json!({ "cmd": "shutdown" }));
+    assert_eq!(shutdown["ok"], true);
+    let status = daemon.wait().unwrap();
+    assert!(status.success(), "Daemon should exit cleanly on shutdown");
+    assert!(!socket.exists(), "Daemon should remove its socket on shutdown");
+    let _ = std::fs::remove_dir_all(&dir);
+}
+
 // Fast synchronous test that checks CLI output without waiting for audio
 #[test]
 fn test_cli_say_output_validation() {